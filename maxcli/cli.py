@@ -7,20 +7,16 @@ management commands.
 """
 
 import argparse
-import json
 import os
-import shutil
-import signal
 import subprocess
 import sys
-import time
-import urllib.request
-import urllib.error
 from pathlib import Path
-from typing import List, Optional, Tuple, Dict, Any
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+from . import __version__
 from .config import is_initialized
-from .modules.module_manager import load_and_register_modules, register_commands as register_module_commands, load_modules_config
+from .utils.help_text import HelpText, LazyHelpFormatter
+from .modules.module_manager import load_and_register_modules, register_commands as register_module_commands, load_modules_config, get_fast_command, get_module_for_command
 
 
 def get_files_to_remove() -> List[Tuple[Path, str]]:
@@ -198,6 +194,7 @@ def uninstall_maxcli(args) -> None:
                     path.unlink()
                     print(f"   ✅ Removed file: {description}")
                 elif path.is_dir():
+                    import shutil
                     shutil.rmtree(path)
                     print(f"   ✅ Removed directory: {description}")
                 else:
@@ -401,6 +398,12 @@ def fetch_github_releases(repo: str = "maximilianls98/maxcli") -> List[Dict[str,
     Returns:
         List of release dictionaries from GitHub API.
     """
+    # Networking and JSON are only needed here; importing them lazily keeps
+    # them (and http.client, ssl, email) off every other command's startup.
+    import json
+    import urllib.error
+    import urllib.request
+    
     print(f"   📡 Fetching releases from GitHub ({repo})...")
     url = f"https://api.github.com/repos/{repo}/releases"
     
@@ -659,37 +662,8 @@ def create_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog='max', 
         description="Max's Personal CLI - A modular collection of useful development and operations commands",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-🚀 Modular CLI System:
-MaxCLI uses a modular architecture where functionality is organized into modules.
-You can enable/disable modules based on your needs to keep the CLI clean and focused.
-
-Module Management:
-  max modules list                # Show all available modules
-  max modules enable <module>     # Enable a module
-  max modules disable <module>    # Disable a module
-
-Core Commands:
-  max config init                 # Initialize CLI with your personal configuration
-  max config backup               # Backup your MaxCLI configuration
-  max config restore              # Restore configuration from backup
-  max update                      # Update MaxCLI to the latest version from GitHub
-  max uninstall                   # Completely remove MaxCLI and all configurations
-  
-Examples of enabled commands (depends on active modules):
-  max ssh list-targets            # Show all saved SSH targets (ssh_manager)
-  max ssh add-target prod ubuntu 192.168.1.100 (ssh_manager)
-  max coolify status              # Check Coolify instance status (coolify_manager)
-  max setup minimal               # Basic development environment setup (setup_manager)
-  max docker clean --extensive    # Clean up Docker system (docker_manager)
-  max openclaw gateway restart    # Restart local OpenClaw gateway (openclaw_manager)
-  max kctx my-k8s-context         # Switch Kubernetes context (kubernetes_manager)
-  max gcp config switch altekai   # Switch gcloud config (gcp_manager)
-  
-Use 'max <command> --help' for detailed help on each command.
-Use 'max modules list' to see available functionality.
-        """
+        formatter_class=LazyHelpFormatter,
+        epilog=HelpText('max.epilog')
     )
     
     # Add version arguments
@@ -698,64 +672,28 @@ Use 'max modules list' to see available functionality.
         action='store_true',
         help='Show MaxCLI version information and check for updates'
     )
+    parser.add_argument(
+        '-V',
+        action='version',
+        version=f'%(prog)s {__version__}',
+        help='Print the MaxCLI version number and exit (no update check)'
+    )
     
     return parser
 
 
-def register_core_commands(subparsers) -> None:
-    """Register core CLI commands that are always available.
+def _build_update_parser(subparsers) -> None:
+    """Register the 'update' command.
     
     Args:
         subparsers: ArgumentParser subparsers object to register commands to.
     """
-    # Update command
     update_parser = subparsers.add_parser(
         'update',
         help='Update MaxCLI to the latest version from GitHub',
-        description="""
-🔄 MaxCLI Updater - Keep Your CLI Up to Date
-
-This command updates MaxCLI to the latest release version from GitHub.
-It performs the following operations:
-
-🔍 Version Checking:
-    • Shows current installed version (git tag or commit hash)
-    • Checks for new releases from GitHub repository
-    • Only considers formal GitHub releases as updates (not every commit)
-
-📋 Release Notes:
-    • Fetches and displays recent release notes from GitHub
-    • Highlights new releases with 🆕 markers
-    • Shows current release with ✅ markers
-    • Indicates pre-releases with 🚧 markers
-
-⚡ Update Process:
-    • Automatically initializes git repository if needed
-    • Checks out the specific release tag (not main branch)
-    • Updates Python dependencies if requirements.txt changed
-    • Preserves all personal configurations and module settings
-
-🔧 Safe Operation:
-    • Uses git to track changes and ensure clean updates
-    • Only updates to stable release versions
-    • Maintains virtual environment integrity
-    • No data loss - configurations remain intact
-    • Immediate availability of new features
-
-The update is performed on the MaxCLI installation at ~/.local/lib/python/maxcli/
-and will immediately be available for use without restarting the terminal.
-
-Note: This command only considers formal GitHub releases as updates. Development
-commits between releases are not considered "updates" to ensure stability.
-        """,
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  max update                      # Update to latest version and show release notes
-  max update --check-only         # Check for updates without installing
-  max update --show-releases      # Show recent release notes without updating
-  max update --check-only --show-releases  # Check updates and show all release notes
-        """
+        description=HelpText('update'),
+        formatter_class=LazyHelpFormatter,
+        epilog=HelpText('update.epilog')
     )
     update_parser.add_argument(
         '--check-only', 
@@ -769,46 +707,19 @@ Examples:
     )
     update_parser.set_defaults(func=update_maxcli)
 
-    # Uninstall command
+
+def _build_uninstall_parser(subparsers) -> None:
+    """Register the 'uninstall' command.
+    
+    Args:
+        subparsers: ArgumentParser subparsers object to register commands to.
+    """
     uninstall_parser = subparsers.add_parser(
         'uninstall',
         help='Completely remove MaxCLI and all its configurations',
-        description="""
-⚠️  DANGER: Complete MaxCLI Uninstallation
-
-This command will completely remove MaxCLI from your system, including:
-
-🗂️  Configuration Files:
-    • ~/.config/maxcli/ (entire directory)
-    • All module configurations and settings
-    • SSH target profiles and connections
-    • Personal git settings and API keys
-
-📁 Installation Files:
-    • ~/.local/lib/python/maxcli/ (MaxCLI library)
-    • ~/bin/max (main executable)
-
-🔧 Shell Configuration:
-    • PATH modification in ~/.zshrc (if added by MaxCLI)
-
-💾 Backup Files (if they exist):
-    • SSH backup files created by ssh_backup module
-    • Temporary files in home directory
-
-This operation is IRREVERSIBLE. All your personal configurations, 
-SSH targets, API keys, and customizations will be permanently lost.
-
-You will need to re-run the bootstrap script to reinstall MaxCLI.
-        """,
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  max uninstall                   # Completely remove MaxCLI (requires double confirmation)
-  max uninstall --force           # Skip confirmations (NOT RECOMMENDED)
-
-After uninstall, to reinstall MaxCLI:
-  curl -sSL <bootstrap-url> | bash
-        """
+        description=HelpText('uninstall'),
+        formatter_class=LazyHelpFormatter,
+        epilog=HelpText('uninstall.epilog')
     )
     uninstall_parser.add_argument(
         '--force', 
@@ -818,12 +729,78 @@ After uninstall, to reinstall MaxCLI:
     uninstall_parser.set_defaults(func=uninstall_maxcli)
 
 
+# Core command name -> parser builder
+CORE_COMMAND_BUILDERS: Dict[str, Callable[[Any], None]] = {
+    'update': _build_update_parser,
+    'uninstall': _build_uninstall_parser,
+}
+
+
+def register_core_commands(subparsers) -> None:
+    """Register core CLI commands that are always available.
+    
+    Args:
+        subparsers: ArgumentParser subparsers object to register commands to.
+    """
+    for build in CORE_COMMAND_BUILDERS.values():
+        build(subparsers)
+
+
+def _requested_command(argv: List[str]) -> Optional[str]:
+    """Return the top-level command named on the command line, if any.
+    
+    Args:
+        argv: Command-line arguments without the program name.
+        
+    Returns:
+        The command name, or None when no command is given, global options
+        come first, or shell completion is running and needs every command.
+    """
+    if not argv or argv[0].startswith('-') or '_ARGCOMPLETE' in os.environ:
+        return None
+    return argv[0]
+
+
+def _skip_argparse_translation() -> None:
+    """Make argparse skip its gettext catalog lookups.
+    
+    MaxCLI help is English-only, but argparse looks up a translation for
+    every help string, usage prefix and error message. Only called from
+    main(), so importing maxcli.cli leaves argparse untouched for other users.
+    """
+    argparse._ = lambda message: message  # type: ignore[attr-defined]
+    argparse.ngettext = lambda singular, plural, n: singular if n == 1 else plural  # type: ignore[attr-defined]
+
+
 def main() -> None:
     """Main CLI entry point with dynamic module loading."""
+    # Answer version probes before any parser construction or module loading.
+    # These are common in shell prompts and scripts, so skip all of the
+    # subcommand registration work they don't need.
+    if len(sys.argv) >= 2 and sys.argv[1] == '-V':
+        print(f"max {__version__}")
+        return
+    if len(sys.argv) >= 2 and sys.argv[1] in ('-v', '--version'):
+        display_version(None)
+        return
+    
+    # Commands without arguments skip parser construction entirely
+    # (shell completion always needs the full parser)
+    if '_ARGCOMPLETE' not in os.environ:
+        fast_command = get_fast_command(sys.argv[1:])
+        if fast_command is not None:
+            func, args = fast_command
+            func(args)
+            return
+    
     # Create the main parser
+    _skip_argparse_translation()
     parser = create_parser()
     
-    # Create subparsers for commands
+    # Create subparsers for commands. Subcommand parsers must stay
+    # standalone: never pass parents=[parser] or repeat top-level options on
+    # them, since argparse copies parent actions into every child and
+    # building the tree becomes quadratic in the number of subcommands.
     subparsers = parser.add_subparsers(
         title="Available Commands", 
         dest="command",
@@ -834,21 +811,30 @@ def main() -> None:
     # Set default behavior when no command is provided
     parser.set_defaults(func=lambda _: parser.print_help())
     
-    # Register core commands (always available)
-    register_core_commands(subparsers)
-    
-    # Register module management commands (always available)
-    register_module_commands(subparsers)
-    
-    # Load and register enabled modules dynamically
-    load_and_register_modules(subparsers)
-    
-    # Enable autocomplete if argcomplete is installed
-    try:
-        import argcomplete  # Optional dependency
-        argcomplete.autocomplete(parser)
-    except ImportError:
-        pass
+    # Only build the parsers the requested command needs. Help, bare 'max',
+    # unknown commands and shell completion still see every command.
+    command = _requested_command(sys.argv[1:])
+    if command in CORE_COMMAND_BUILDERS:
+        CORE_COMMAND_BUILDERS[command](subparsers)
+    elif command == 'modules':
+        register_module_commands(subparsers)
+    elif command is None or get_module_for_command(command) is None:
+        register_core_commands(subparsers)
+        register_module_commands(subparsers)
+        load_and_register_modules(subparsers)
+    elif not load_and_register_modules(subparsers, command=command):
+        # The owning module is disabled; list every valid choice in the error
+        register_core_commands(subparsers)
+        register_module_commands(subparsers)
+    
+    # Enable autocomplete if argcomplete is installed. The shell completion
+    # hook sets _ARGCOMPLETE, so other runs skip importing argcomplete.
+    if '_ARGCOMPLETE' in os.environ:
+        try:
+            import argcomplete  # Optional dependency
+            argcomplete.autocomplete(parser)
+        except ImportError:
+            pass
     
     # Parse arguments
     args = parser.parse_args()
@@ -1 +1,22 @@
-"""Command modules for MaxCLI.""" 
\ No newline at end of file
+"""Command modules for MaxCLI.
+
+Submodules are imported on first attribute access (PEP 562), so
+``from maxcli.commands import coolify`` only loads the coolify commands.
+"""
+
+import importlib
+from typing import Any, List
+
+_SUBMODULES = frozenset({"coolify", "docker", "gcp", "kubernetes", "misc", "openclaw", "setup"})
+
+
+def __getattr__(name: str) -> Any:
+    if name in _SUBMODULES:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | _SUBMODULES)
@@ -1,12 +1,46 @@
 """Coolify API management commands."""
+import http.client
 import json
 import sys
-from typing import Dict, List, Optional, Any, Tuple
-import subprocess
+import threading
+import urllib.parse
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from ..config import get_config_value
 
+def _stdlib_json_dumps(data: Any) -> bytes:
+    return json.dumps(data).encode('utf-8')
+
+_json_loads: Callable[[Union[str, bytes]], Any]
+_json_dumps: Callable[[Any], bytes]
+try:
+    # orjson is optional; it parses large API listings much faster
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = _stdlib_json_dumps
+
+# Per-thread keep-alive connections to the Coolify instance, keyed by URL
+_connections = threading.local()
+
+# Coolify API key and normalized instance URL, once they have been found in
+# the config
+_coolify_config: Optional[Tuple[str, str]] = None
+
 def get_coolify_config() -> Tuple[Optional[str], Optional[str]]:
-    """Get Coolify API key and instance URL from config."""
+    """Get Coolify API key and instance URL from config.
+    
+    A complete configuration is cached for the life of the process, so the
+    config file is read and the URL normalized once however many API requests
+    a command makes. A missing configuration is not cached, so settings saved
+    later in the same process are picked up.
+    """
+    global _coolify_config
+    if _coolify_config is not None:
+        return _coolify_config
+    
     api_key = get_config_value('coolify_api_key')
     instance_url = get_config_value('coolify_instance_url')
     
@@ -16,12 +50,54 @@ def get_coolify_config() -> Tuple[Optional[str], Optional[str]]:
         return None, None
     
     # Ensure instance URL doesn't end with trailing slash
-    instance_url = instance_url.rstrip('/')
-    
-    return api_key, instance_url
+    _coolify_config = (api_key, instance_url.rstrip('/'))
+    return _coolify_config
+
+def _get_connection(instance_url: str) -> http.client.HTTPConnection:
+    """Get this thread's keep-alive connection to the Coolify instance.
+    
+    Connections are reused across requests so repeated API calls share one
+    TCP/TLS handshake. Each thread gets its own connection because
+    http.client connections are not thread-safe.
+    """
+    connections = getattr(_connections, 'by_url', None)
+    if connections is None:
+        connections = _connections.by_url = {}
+    
+    connection = connections.get(instance_url)
+    if connection is None:
+        parts = urllib.parse.urlsplit(instance_url)
+        connection_class = http.client.HTTPSConnection if parts.scheme == 'https' else http.client.HTTPConnection
+        connection = connection_class(parts.netloc, timeout=30)
+        connections[instance_url] = connection
+    return connection
+
+def _send_request(instance_url: str, method: str, path: str, body: Optional[bytes], headers: Dict[str, str]) -> str:
+    """Send a request over the shared connection and return the response body.
+    
+    If the connection turns out to be dead (e.g. the server closed it while
+    idle), it is closed and the request is retried once; http.client then
+    opens a new socket for the same connection object. Requests that failed
+    while being sent never reached the server and are always retried.
+    Failures while waiting for the response are only retried for GET and
+    HEAD, since the server may already have acted on other methods.
+    """
+    connection = _get_connection(instance_url)
+    retried = False
+    while True:
+        sent = False
+        try:
+            connection.request(method, path, body=body, headers=headers)
+            sent = True
+            return connection.getresponse().read().decode('utf-8', errors='replace')
+        except (http.client.HTTPException, ConnectionError):
+            connection.close()
+            if retried or (sent and method not in ('GET', 'HEAD')):
+                raise
+            retried = True
 
 def make_coolify_request(endpoint: str, method: str = 'GET', data: Optional[Dict] = None, expect_json: bool = True) -> Optional[Any]:
-    """Make a request to the Coolify API using curl."""
+    """Make a request to the Coolify API over a persistent HTTP connection."""
     api_key, instance_url = get_coolify_config()
     if not api_key or not instance_url:
         return None
@@ -33,27 +109,25 @@ def make_coolify_request(endpoint: str, method: str = 'GET', data: Optional[Dict
         else:
             endpoint = f"/api/v1/{endpoint}"
     
-    url = f"{instance_url}{endpoint}"
+    # Keep any path prefix the instance is served under
+    path = f"{urllib.parse.urlsplit(instance_url).path}{endpoint}"
     
-    # Build curl command
-    curl_cmd = [
-        'curl', '-s', '-X', method,
-        '-H', f'Authorization: Bearer {api_key}',
-        '-H', 'Content-Type: application/json',
-        '-H', 'Accept: application/json'
-    ]
+    headers = {
+        'Authorization': f'Bearer {api_key}',
+        'Content-Type': 'application/json',
+        'Accept': 'application/json'
+    }
     
     # Add data for POST/PATCH requests
+    body = None
     if data and method in ['POST', 'PATCH']:
-        curl_cmd.extend(['-d', json.dumps(data)])
-    
-    curl_cmd.append(url)
+        body = _json_dumps(data)
     
     try:
-        result = subprocess.run(curl_cmd, capture_output=True, text=True, check=True)
-        if result.stdout:
+        response_text = _send_request(instance_url, method, path, body, headers)
+        if response_text:
             # Check if response looks like HTML (authentication redirect)
-            if result.stdout.strip().startswith('<!DOCTYPE html>') or result.stdout.strip().startswith('<html'):
+            if response_text.strip().startswith('<!DOCTYPE html>') or response_text.strip().startswith('<html'):
                 print("❌ Authentication failed - received HTML redirect instead of JSON")
                 print("💡 This usually means:")
                 print("   • Your API key is invalid or expired")
@@ -64,10 +138,10 @@ def make_coolify_request(endpoint: str, method: str = 'GET', data: Optional[Dict
             
             # If we don't expect JSON, return the raw text
             if not expect_json:
-                return result.stdout.strip()
+                return response_text.strip()
             
             try:
-                json_response = json.loads(result.stdout)
+                json_response = _json_loads(response_text)
                 
                 # Check for permission errors
                 if isinstance(json_response, dict) and 'message' in json_response:
@@ -85,65 +159,83 @@ def make_coolify_request(endpoint: str, method: str = 'GET', data: Optional[Dict
                 return json_response
             except json.JSONDecodeError:
                 print(f"❌ Invalid JSON response from Coolify API")
-                print(f"Response preview: {result.stdout[:200]}...")
+                print(f"Response preview: {response_text[:200]}...")
                 return None
         return {} if expect_json else ""
-    except subprocess.CalledProcessError as e:
+    except (http.client.HTTPException, OSError) as e:
         print(f"❌ API request failed: {e}")
-        if e.stderr:
-            print(f"Error: {e.stderr}")
         return None
     except Exception as e:
         print(f"❌ Unexpected error: {e}")
         return None
 
+# Exact status values mapped to their display form.
+_STATUS_MAP: Dict[str, str] = {
+    'running': '🟢 Running',
+    'stopped': '🔴 Stopped',
+    'starting': '🟡 Starting',
+    'stopping': '🟡 Stopping',
+    'restarting': '🟡 Restarting',
+    'exited': '🔴 Exited',
+    'healthy': '🟢 Healthy',
+    'unhealthy': '🔴 Unhealthy',
+    'reachable': '🟢 Reachable',
+    'unreachable': '🔴 Unreachable',
+    'unknown': '⚪ Unknown',
+}
+
+# Composite "state:health" statuses, matched anywhere in the status string.
+_COMPOSITE_STATUSES: Tuple[Tuple[str, str], ...] = (
+    ('running:unhealthy', '🟢 Running (⚠️  health check failing)'),
+    ('running:healthy', '🟢 Running'),
+    ('exited:unhealthy', '🔴 Exited (stopped manually)'),
+)
+
+# Partial matches, used when nothing more specific applies.
+_PARTIAL_STATUSES: Tuple[Tuple[str, str], ...] = (
+    ('running', '🟢 Running'),
+    ('stopped', '🔴 Stopped'),
+    ('exited', '🔴 Exited'),
+    ('starting', '🟡 Starting'),
+    ('stopping', '🟡 Stopping'),
+)
+
+# Statuses counted as running or stopped in the status overview. Coolify
+# reports composite statuses as "state:health", so only the prefix matters.
+_RUNNING_STATUSES = frozenset({'running', 'healthy'})
+_STOPPED_STATUSES = frozenset({'stopped', 'exited'})
+_RUNNING_PREFIXES = ('running:',)
+_STOPPED_PREFIXES = ('exited:',)
+
+@lru_cache(maxsize=64)
 def format_status(status: str) -> str:
-    """Format status with appropriate emoji and color."""
-    status_lower = status.lower()
+    """Format status with appropriate emoji and color.
     
-    # Handle composite statuses first (most specific)
-    if 'running:unhealthy' in status_lower:
-        return '🟢 Running (⚠️  health check failing)'
-    elif 'running:healthy' in status_lower:
-        return '🟢 Running'
-    elif 'exited:unhealthy' in status_lower:
-        return '🔴 Exited (stopped manually)'
-    # Handle single-word statuses
-    elif status_lower == 'running':
-        return '🟢 Running'
-    elif status_lower == 'stopped':
-        return '🔴 Stopped'
-    elif status_lower == 'starting':
-        return '🟡 Starting'
-    elif status_lower == 'stopping':
-        return '🟡 Stopping'
-    elif status_lower == 'restarting':
-        return '🟡 Restarting'
-    elif status_lower == 'exited':
-        return '🔴 Exited'
-    elif status_lower == 'healthy':
-        return '🟢 Healthy'
-    elif status_lower == 'unhealthy':
-        return '🔴 Unhealthy'
-    elif status_lower == 'reachable':
-        return '🟢 Reachable'
-    elif status_lower == 'unreachable':
-        return '🔴 Unreachable'
-    elif status_lower == 'unknown':
-        return '⚪ Unknown'
-    # Fallback for partial matches
-    elif 'running' in status_lower:
-        return f'🟢 Running ({status})'
-    elif 'stopped' in status_lower:
-        return f'🔴 Stopped ({status})'
-    elif 'exited' in status_lower:
-        return f'🔴 Exited ({status})'
-    elif 'starting' in status_lower:
-        return f'🟡 Starting ({status})'
-    elif 'stopping' in status_lower:
-        return f'🟡 Stopping ({status})'
-    else:
-        return f"⚪ {status}"
+    Resources share a handful of status values, so results are cached.
+    """
+    status_lower = status.lower()
+
+    # Exact single-word statuses cannot contain a composite, so check them first
+    formatted = _STATUS_MAP.get(status_lower)
+    if formatted is not None:
+        return formatted
+
+    for key, formatted in _COMPOSITE_STATUSES:
+        if key in status_lower:
+            return formatted
+
+    for key, label in _PARTIAL_STATUSES:
+        if key in status_lower:
+            return f'{label} ({status})'
+
+    return f"⚪ {status}"
+
+def _server_name(resource: Dict[str, Any]) -> str:
+    """Extract the server name from a resource's nested destination/server/name structure."""
+    try:
+        return resource['destination']['server']['name'] or 'Unknown'
+    except (KeyError, TypeError):
+        return 'Unknown'
 
 def coolify_health(args) -> None:
     """Check Coolify instance health."""
@@ -181,26 +273,27 @@ def coolify_services(args) -> None:
         return
     
     services = response
-    print(f"\n📊 Found {len(services)} service(s):")
-    print("=" * 80)
+    # Build the listing and write it to stdout in one call
+    lines: List[str] = []
+    # Bind to locals, which are cheaper to look up in the loop below
+    append = lines.append
+    fmt_status = format_status
+    append(f"\n📊 Found {len(services)} service(s):\n")
+    append("=" * 80 + "\n")
     
     for service in services:
         name = service.get('name', 'Unknown')
         status = service.get('status', 'Unknown')
         uuid = service.get('uuid', 'N/A')
-        # Extract server name from nested destination/server/name structure
-        server_name = 'Unknown'
-        destination = service.get('destination')
-        if destination and isinstance(destination, dict):
-            server = destination.get('server')
-            if server and isinstance(server, dict):
-                server_name = server.get('name', 'Unknown')
+        server_name = _server_name(service)
         
-        print(f"📦 {name}")
-        print(f"   Status: {format_status(status)}")
-        print(f"   Server: {server_name}")
-        print(f"   UUID: {uuid}")
-        print("-" * 40)
+        append(f"📦 {name}\n")
+        append(f"   Status: {fmt_status(status)}\n")
+        append(f"   Server: {server_name}\n")
+        append(f"   UUID: {uuid}\n")
+        append("-" * 40 + "\n")
+    
+    sys.stdout.write("".join(lines))
 
 def coolify_applications(args) -> None:
     """List all applications and their status."""
@@ -221,20 +314,19 @@ def coolify_applications(args) -> None:
         return
     
     applications = response
-    print(f"\n📊 Found {len(applications)} application(s):")
-    print("=" * 80)
+    # Build the listing and write it to stdout in one call
+    lines: List[str] = []
+    # Bind to locals, which are cheaper to look up in the loop below
+    append = lines.append
+    fmt_status = format_status
+    append(f"\n📊 Found {len(applications)} application(s):\n")
+    append("=" * 80 + "\n")
     
     for app in applications:
         name = app.get('name', 'Unknown')
         status = app.get('status', 'Unknown')
         uuid = app.get('uuid', 'N/A')
-        # Extract server name from nested destination/server/name structure
-        server_name = 'Unknown'
-        destination = app.get('destination')
-        if destination and isinstance(destination, dict):
-            server = destination.get('server')
-            if server and isinstance(server, dict):
-                server_name = server.get('name', 'Unknown')
+        server_name = _server_name(app)
         # This might cause issues if other people want to use my script and their coolify is not on hetzner
         if server_name == 'localhost':
             server_name = 'Hetzner'
@@ -242,15 +334,17 @@ def coolify_applications(args) -> None:
         branch = app.get('git_branch', 'N/A')
         fqdn = app.get('fqdn', 'N/A')
         
-        print(f"🚀 {name}")
-        print(f"   Status: {format_status(status)}")
-        print(f"   Server: {server_name}")
-        print(f"   FQDN: {fqdn}")
-        print(f"   Repository: {repository}")
+        append(f"🚀 {name}\n")
+        append(f"   Status: {fmt_status(status)}\n")
+        append(f"   Server: {server_name}\n")
+        append(f"   FQDN: {fqdn}\n")
+        append(f"   Repository: {repository}\n")
         if branch and branch != 'N/A':
-            print(f"   Branch: {branch}")
-        print(f"   UUID: {uuid}")
-        print("-" * 40)
+            append(f"   Branch: {branch}\n")
+        append(f"   UUID: {uuid}\n")
+        append("-" * 40 + "\n")
+    
+    sys.stdout.write("".join(lines))
 
 def coolify_servers(args) -> None:
     """List all servers and their status."""
@@ -271,8 +365,13 @@ def coolify_servers(args) -> None:
         return
     
     servers = response
-    print(f"\n📊 Found {len(servers)} server(s):")
-    print("=" * 80)
+    # Build the listing and write it to stdout in one call
+    lines: List[str] = []
+    # Bind to locals, which are cheaper to look up in the loop below
+    append = lines.append
+    fmt_status = format_status
+    append(f"\n📊 Found {len(servers)} server(s):\n")
+    append("=" * 80 + "\n")
     
     for server in servers:
         name = server.get('name', 'Unknown')
@@ -286,11 +385,13 @@ def coolify_servers(args) -> None:
         else:
             status_text = 'unknown'
         
-        print(f"🖥️  {name}")
-        print(f"   Status: {format_status(status_text)}")
-        print(f"   IP: {ip}")
-        print(f"   UUID: {uuid}")
-        print("-" * 40)
+        append(f"🖥️  {name}\n")
+        append(f"   Status: {fmt_status(status_text)}\n")
+        append(f"   IP: {ip}\n")
+        append(f"   UUID: {uuid}\n")
+        append("-" * 40 + "\n")
+    
+    sys.stdout.write("".join(lines))
 
 def coolify_resources(args) -> None:
     """List all resources (combined view)."""
@@ -311,99 +412,123 @@ def coolify_resources(args) -> None:
         return
     
     resources = response
-    print(f"\n📊 Found {len(resources)} resource(s):")
-    print("=" * 80)
+    # Build the listing and write it to stdout in one call
+    lines: List[str] = []
+    # Bind to locals, which are cheaper to look up in the loop below
+    append = lines.append
+    fmt_status = format_status
+    append(f"\n📊 Found {len(resources)} resource(s):\n")
+    append("=" * 80 + "\n")
     
     # Group resources by type
     by_type: Dict[str, List[Dict[str, Any]]] = {}
     for resource in resources:
-        resource_type = resource.get('type', resource.get('resource_type', 'unknown'))
-        if resource_type not in by_type:
-            by_type[resource_type] = []
-        by_type[resource_type].append(resource)
+        resource_type = resource.get('type') or resource.get('resource_type', 'unknown')
+        by_type.setdefault(resource_type, []).append(resource)
     
     for resource_type, items in by_type.items():
-        print(f"\n📂 {resource_type.title()} ({len(items)})")
-        print("-" * 60)
+        append(f"\n📂 {resource_type.title()} ({len(items)})\n")
+        append("-" * 60 + "\n")
         
         for item in items:
             name = item.get('name', 'Unknown')
             status = item.get('status', 'Unknown')
             uuid = item.get('uuid', 'N/A')
             
-            print(f"   📋 {name}")
-            print(f"      Status: {format_status(status)}")
-            print(f"      UUID: {uuid}")
-
-def coolify_start_service(args) -> None:
-    """Start a service by UUID."""
-    if not args.uuid:
-        print("❌ Service UUID is required")
-        print("💡 Use 'max coolify services' to list available services and their UUIDs")
-        sys.exit(1)
+            append(f"   📋 {name}\n")
+            append(f"      Status: {fmt_status(status)}\n")
+            append(f"      UUID: {uuid}\n")
     
-    print(f"🚀 Starting service {args.uuid}...")
+    sys.stdout.write("".join(lines))
+
+def _get_uuids(args, kind: str) -> List[str]:
+    """Collect the UUIDs given positionally and via --uuids.
+    
+    Empty entries are skipped and repeated UUIDs are only acted on once.
+    Without any UUID this exits with status 2, the exit status argparse uses
+    for a missing required argument.
+    """
+    uuids = [args.uuid] if args.uuid else []
+    batch = getattr(args, 'uuids', None) or ''
+    uuids.extend(uuid.strip() for uuid in batch.split(','))
+    uuids = list(dict.fromkeys(uuid for uuid in uuids if uuid))
+    
+    if not uuids:
+        command = getattr(args, 'coolify_command', None) or f'<{kind}-command>'
+        print(f"❌ Error: a {kind} UUID is required")
+        print(f"   Usage: max coolify {command} <uuid> [--uuids UUID,...]")
+        print(f"💡 Use 'max coolify {kind}s' to list available {kind}s and their UUIDs")
+        sys.exit(2)
+    return uuids
+
+def _run_uuid_action(args, kind: str, action: str, progress: str, success: str) -> None:
+    """Send a lifecycle request such as start or deploy for each given UUID.
+    
+    A single UUID is handled exactly as before. Several UUIDs (from --uuids)
+    are sent concurrently over the per-thread keep-alive connections and
+    reported in the order given, so bulk operations pay for one CLI startup.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    
+    uuids = _get_uuids(args, kind)
+    if len(uuids) == 1:
+        uuid = uuids[0]
+        print(f"{progress} {uuid}...")
+        
+        response = make_coolify_request(f'/{kind}s/{uuid}/{action}')
+        if response is None:
+            sys.exit(1)
+        
+        print(f"✅ {success}")
+        if response:
+            print(f"Response: {json.dumps(response, indent=2)}")
+        return
     
-    response = make_coolify_request(f'/services/{args.uuid}/start')
-    if response is None:
+    for uuid in uuids:
+        print(f"{progress} {uuid}...")
+    
+    with ThreadPoolExecutor(max_workers=min(len(uuids), 8)) as executor:
+        responses = list(executor.map(
+            lambda uuid: make_coolify_request(f'/{kind}s/{uuid}/{action}'), uuids
+        ))
+    
+    failed = []
+    for uuid, response in zip(uuids, responses):
+        if response is None:
+            failed.append(uuid)
+            continue
+        print(f"✅ {uuid}: {success}")
+        if response:
+            print(f"Response: {json.dumps(response, indent=2)}")
+    
+    if failed:
+        print(f"❌ {len(failed)} of {len(uuids)} {kind}s failed: {', '.join(failed)}")
         sys.exit(1)
-    
-    print("✅ Service start command sent successfully!")
-    if response:
-        print(f"Response: {json.dumps(response, indent=2)}")
+
+def coolify_start_service(args) -> None:
+    """Start one or more services by UUID."""
+    _run_uuid_action(args, 'service', 'start', "🚀 Starting service", "Service start command sent successfully!")
 
 def coolify_stop_service(args) -> None:
-    """Stop a service by UUID."""
-    if not args.uuid:
-        print("❌ Service UUID is required")
-        print("💡 Use 'max coolify services' to list available services and their UUIDs")
-        sys.exit(1)
-    
-    print(f"🛑 Stopping service {args.uuid}...")
-    
-    response = make_coolify_request(f'/services/{args.uuid}/stop')
-    if response is None:
-        sys.exit(1)
-    
-    print("✅ Service stop command sent successfully!")
-    if response:
-        print(f"Response: {json.dumps(response, indent=2)}")
+    """Stop one or more services by UUID."""
+    _run_uuid_action(args, 'service', 'stop', "🛑 Stopping service", "Service stop command sent successfully!")
 
 def coolify_restart_service(args) -> None:
-    """Restart a service by UUID."""
-    if not args.uuid:
-        print("❌ Service UUID is required")
-        print("💡 Use 'max coolify services' to list available services and their UUIDs")
-        sys.exit(1)
-    
-    print(f"🔄 Restarting service {args.uuid}...")
-    
-    response = make_coolify_request(f'/services/{args.uuid}/restart')
-    if response is None:
-        sys.exit(1)
-    
-    print("✅ Service restart command sent successfully!")
-    if response:
-        print(f"Response: {json.dumps(response, indent=2)}")
+    """Restart one or more services by UUID."""
+    _run_uuid_action(args, 'service', 'restart', "🔄 Restarting service", "Service restart command sent successfully!")
 
 def coolify_status(args) -> None:
     """Show overall Coolify status with summary of all resources."""
+    from concurrent.futures import ThreadPoolExecutor
+    
     print("🔍 Getting Coolify status overview...")
     
-    # Check health first
-    health_response = make_coolify_request('/health', expect_json=False)
-    if health_response is None:
+    # Check configuration once up front instead of once per parallel request
+    api_key, instance_url = get_coolify_config()
+    if not api_key or not instance_url:
         print("❌ Could not connect to Coolify instance")
         sys.exit(1)
     
-    if health_response and health_response.lower() == 'ok':
-        print("✅ Coolify instance is healthy!")
-    else:
-        print("⚠️  Coolify instance status unclear")
-        print(f"Health response: {health_response}")
-    
-    print("=" * 60)
-    
     # Get summary of each resource type
     resource_types = [
         ('applications', '🚀 Applications'),
@@ -412,92 +537,72 @@ def coolify_status(args) -> None:
         ('databases', '🗄️  Databases')
     ]
     
-    for endpoint, label in resource_types:
-        response = make_coolify_request(f'/{endpoint}')
-        if response and isinstance(response, list):
-            resources = response
-            count = len(resources)
-            
-            # Count by status
-            running = sum(1 for r in resources if r.get('status', '').lower() in ['running', 'healthy'] or 'running:' in r.get('status', '').lower())
-            stopped = sum(1 for r in resources if r.get('status', '').lower() in ['stopped', 'exited'] or 'exited:' in r.get('status', '').lower())
-            other = count - running - stopped
-            
-            print(f"{label}: {count} total")
-            if count > 0:
-                print(f"   🟢 Running/Healthy: {running}")
-                print(f"   🔴 Stopped/Exited: {stopped}")
-                if other > 0:
-                    print(f"   🟡 Other states: {other}")
-            print()
-        else:
-            print(f"{label}: Unable to fetch")
-            print()
+    with ThreadPoolExecutor(max_workers=len(resource_types)) as executor:
+        # Check health first so an unreachable instance fails after one
+        # request; the worker that ran it keeps its connection open and is
+        # reused for the first resource listing
+        health_response = executor.submit(make_coolify_request, '/health', expect_json=False).result()
+        if health_response is None:
+            print("❌ Could not connect to Coolify instance")
+            sys.exit(1)
+        
+        if health_response.lower() != 'ok':
+            print("⚠️  Coolify instance status unclear")
+            print(f"Health response: {health_response}")
+            return
+        
+        print("✅ Coolify instance is healthy!")
+        
+        # The resource listings are independent, so fetch them concurrently
+        # and report them in a fixed order
+        resource_futures = [
+            executor.submit(make_coolify_request, f'/{endpoint}') for endpoint, _ in resource_types
+        ]
+        
+        # Build the summary and write it to stdout in one call
+        lines: List[str] = ["=" * 60 + "\n"]
+        
+        for (endpoint, label), future in zip(resource_types, resource_futures):
+            response = future.result()
+            if response and isinstance(response, list):
+                resources = response
+                count = len(resources)
+                
+                # Count by status in a single pass
+                running = stopped = 0
+                for resource in resources:
+                    status = resource.get('status', '').lower()
+                    if status in _RUNNING_STATUSES or status.startswith(_RUNNING_PREFIXES):
+                        running += 1
+                    elif status in _STOPPED_STATUSES or status.startswith(_STOPPED_PREFIXES):
+                        stopped += 1
+                other = count - running - stopped
+                
+                lines.append(f"{label}: {count} total\n")
+                if count > 0:
+                    lines.append(f"   🟢 Running/Healthy: {running}\n")
+                    lines.append(f"   🔴 Stopped/Exited: {stopped}\n")
+                    if other > 0:
+                        lines.append(f"   🟡 Other states: {other}\n")
+                lines.append("\n")
+            else:
+                lines.append(f"{label}: Unable to fetch\n")
+                lines.append("\n")
+    
+    sys.stdout.write("".join(lines))
 
 def coolify_start_application(args) -> None:
-    """Start an application by UUID."""
-    if not args.uuid:
-        print("❌ Application UUID is required")
-        print("💡 Use 'max coolify applications' to list available applications and their UUIDs")
-        sys.exit(1)
-    
-    print(f"🚀 Starting application {args.uuid}...")
-    
-    response = make_coolify_request(f'/applications/{args.uuid}/start')
-    if response is None:
-        sys.exit(1)
-    
-    print("✅ Application start command sent successfully!")
-    if response:
-        print(f"Response: {json.dumps(response, indent=2)}")
+    """Start one or more applications by UUID."""
+    _run_uuid_action(args, 'application', 'start', "🚀 Starting application", "Application start command sent successfully!")
 
 def coolify_stop_application(args) -> None:
-    """Stop an application by UUID."""
-    if not args.uuid:
-        print("❌ Application UUID is required")
-        print("💡 Use 'max coolify applications' to list available applications and their UUIDs")
-        sys.exit(1)
-    
-    print(f"🛑 Stopping application {args.uuid}...")
-    
-    response = make_coolify_request(f'/applications/{args.uuid}/stop')
-    if response is None:
-        sys.exit(1)
-    
-    print("✅ Application stop command sent successfully!")
-    if response:
-        print(f"Response: {json.dumps(response, indent=2)}")
+    """Stop one or more applications by UUID."""
+    _run_uuid_action(args, 'application', 'stop', "🛑 Stopping application", "Application stop command sent successfully!")
 
 def coolify_restart_application(args) -> None:
-    """Restart an application by UUID."""
-    if not args.uuid:
-        print("❌ Application UUID is required")
-        print("💡 Use 'max coolify applications' to list available applications and their UUIDs")
-        sys.exit(1)
-    
-    print(f"🔄 Restarting application {args.uuid}...")
-    
-    response = make_coolify_request(f'/applications/{args.uuid}/restart')
-    if response is None:
-        sys.exit(1)
-    
-    print("✅ Application restart command sent successfully!")
-    if response:
-        print(f"Response: {json.dumps(response, indent=2)}")
+    """Restart one or more applications by UUID."""
+    _run_uuid_action(args, 'application', 'restart', "🔄 Restarting application", "Application restart command sent successfully!")
 
 def coolify_deploy_application(args) -> None:
-    """Deploy an application by UUID."""
-    if not args.uuid:
-        print("❌ Application UUID is required")
-        print("💡 Use 'max coolify applications' to list available applications and their UUIDs")
-        sys.exit(1)
-    
-    print(f"🚀 Deploying application {args.uuid}...")
-    
-    response = make_coolify_request(f'/applications/{args.uuid}/deploy')
-    if response is None:
-        sys.exit(1)
-    
-    print("✅ Application deployment started successfully!")
-    if response:
-        print(f"Response: {json.dumps(response, indent=2)}") 
\ No newline at end of file
+    """Deploy one or more applications by UUID."""
+    _run_uuid_action(args, 'application', 'deploy', "🚀 Deploying application", "Application deployment started successfully!")
@@ -1,6 +1,7 @@
 """Docker related commands."""
 import sys
 import subprocess
+from typing import List
 
 
 def docker_clean_extensive() -> None:
@@ -14,6 +15,24 @@ def docker_clean_extensive() -> None:
         sys.exit(1)
 
 
+# Minimal cleanup steps as (progress message, command)
+_CONTAINER_PRUNE = (
+    "Removing containers stopped >24h ago...",
+    ["docker", "container", "prune", "-f", "--filter", "until=24h"],
+)
+_IMAGE_PRUNE = ("Removing dangling images...", ["docker", "image", "prune", "-f"])
+_NETWORK_PRUNE = ("Removing unused networks...", ["docker", "network", "prune", "-f"])
+_BUILDER_PRUNE = (
+    "Removing build cache >7 days old...",
+    ["docker", "builder", "prune", "-f", "--filter", "until=168h"],  # 7 days = 168 hours
+)
+
+
+def _run_prune(command: List[str]) -> subprocess.CompletedProcess:
+    """Run a Docker prune command, capturing its output for ordered display."""
+    return subprocess.run(command, check=True, capture_output=True, text=True)
+
+
 def docker_clean_minimal() -> None:
     """
     Perform a gentle Docker cleanup that only removes truly unused items.
@@ -22,42 +41,49 @@ def docker_clean_minimal() -> None:
     - All images that might be reused
     - Recent containers (only removes containers stopped >24h ago)
     - Volumes (never touches volumes)
+    
+    The prune commands run concurrently where they are independent. Build
+    cache pruning runs alongside everything else, while images and networks
+    are pruned once the container prune has finished, since only then are
+    the ones used by removed containers free. Output is shown in a fixed
+    order, and every step runs even if another one fails.
     """
+    from concurrent.futures import ThreadPoolExecutor, wait
+    
     print("🧹 Performing minimal Docker cleanup...")
     
-    try:
-        # Remove containers that have been stopped for more than 24 hours
-        print("Removing containers stopped >24h ago...")
-        subprocess.run([
-            "docker", "container", "prune", "-f", 
-            "--filter", "until=24h"
-        ], check=True)
-        
-        # Remove only dangling images (untagged/unreferenced)
-        print("Removing dangling images...")
-        subprocess.run([
-            "docker", "image", "prune", "-f"
-        ], check=True)
-        
-        # Remove unused networks
-        print("Removing unused networks...")
-        subprocess.run([
-            "docker", "network", "prune", "-f"
-        ], check=True)
-        
-        # Remove build cache older than 7 days
-        print("Removing build cache >7 days old...")
-        subprocess.run([
-            "docker", "builder", "prune", "-f",
-            "--filter", "until=168h"  # 7 days = 168 hours
-        ], check=True)
-        
-        print("✅ Minimal Docker cleanup completed!")
-        print("💡 For extensive cleanup, use 'max docker clean --extensive'")
-        
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Error during Docker cleanup: {e}", file=sys.stderr)
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        builder_future = executor.submit(_run_prune, _BUILDER_PRUNE[1])
+        container_future = executor.submit(_run_prune, _CONTAINER_PRUNE[1])
+        wait([container_future])
+        image_future = executor.submit(_run_prune, _IMAGE_PRUNE[1])
+        network_future = executor.submit(_run_prune, _NETWORK_PRUNE[1])
+    
+    errors = []
+    for (message, _), future in (
+        (_CONTAINER_PRUNE, container_future),
+        (_IMAGE_PRUNE, image_future),
+        (_NETWORK_PRUNE, network_future),
+        (_BUILDER_PRUNE, builder_future),
+    ):
+        print(message)
+        try:
+            result = future.result()
+        except subprocess.CalledProcessError as e:
+            if e.stderr:
+                print(e.stderr, end="", file=sys.stderr)
+            errors.append(e)
+            continue
+        if result.stdout:
+            print(result.stdout, end="")
+    
+    if errors:
+        for error in errors:
+            print(f"❌ Error during Docker cleanup: {error}", file=sys.stderr)
         sys.exit(1)
+    
+    print("✅ Minimal Docker cleanup completed!")
+    print("💡 For extensive cleanup, use 'max docker clean --extensive'")
 
 
 def docker_clean_command(args) -> None:
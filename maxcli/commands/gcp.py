@@ -1,5 +1,6 @@
 """Google Cloud Platform related commands."""
 import os
+import shutil
 import sys
 import subprocess
 from typing import List, Optional
@@ -7,15 +8,21 @@ from typing import List, Optional
 from ..config import get_quota_project_mappings, load_config, save_config
 from ..utils.interactive import interactive_selection
 
+# gcloud's config directory and the ADC file gcloud reads credentials from
+_GCLOUD_DIR = os.path.expanduser("~/.config/gcloud")
+_DEFAULT_ADC = os.path.join(_GCLOUD_DIR, "application_default_credentials.json")
+
 def get_available_configs() -> List[str]:
     """Get list of available gcloud configurations with ADC files."""
-    configs = []
-    adc_dir = os.path.expanduser("~/.config/gcloud")
-    if os.path.exists(adc_dir):
-        for f in os.listdir(adc_dir):
-            if f.startswith("adc_") and f.endswith(".json"):
-                configs.append(f[4:-5])  # Remove "adc_" prefix and ".json" suffix
-    return sorted(configs)
+    try:
+        with os.scandir(_GCLOUD_DIR) as entries:
+            # Remove "adc_" prefix and ".json" suffix
+            return sorted(
+                entry.name[4:-5] for entry in entries
+                if entry.name.startswith("adc_") and entry.name.endswith(".json") and entry.is_file()
+            )
+    except FileNotFoundError:
+        return []
 
 def get_active_config() -> Optional[str]:
     """Get the currently active gcloud configuration."""
@@ -59,11 +66,12 @@ def switch_config(args):
     print(f"Switching gcloud config to '{config_name}'...")
     subprocess.run(["gcloud", "config", "configurations", "activate", config_name], check=True)
 
-    adc_file = os.path.expanduser(f"~/.config/gcloud/adc_{config_name}.json")
-    dest_adc = os.path.expanduser("~/.config/gcloud/application_default_credentials.json")
+    adc_file = os.path.join(_GCLOUD_DIR, f"adc_{config_name}.json")
+    dest_adc = _DEFAULT_ADC
 
     if os.path.exists(adc_file):
-        subprocess.run(["cp", adc_file, dest_adc], check=True)
+        # Copy in-process; shutil.copy also keeps the credentials' file mode like cp
+        shutil.copy(adc_file, dest_adc)
         print(f"Switched ADC credentials for config '{config_name}'.")
 
         quota_project_mappings = get_quota_project_mappings()
@@ -84,57 +92,64 @@ def create_config(args):
     print(f"Creating new gcloud configuration '{config_name}'...")
     
     try:
-        # Step 1: Create new configuration
+        # Step 1: Create and activate the new configuration ('create' activates it by default)
         print("Creating gcloud configuration...")
         subprocess.run(["gcloud", "config", "configurations", "create", config_name], check=True)
         
-        # Step 2: Activate the new configuration
-        print(f"Activating configuration '{config_name}'...")
-        subprocess.run(["gcloud", "config", "configurations", "activate", config_name], check=True)
-        
-        # Step 3: Authenticate with Google account
+        # Step 2: Authenticate with Google account and set up application
+        # default credentials in the same login flow
         print("Please authenticate with your Google account...")
-        subprocess.run(["gcloud", "auth", "login"], check=True)
+        subprocess.run(["gcloud", "auth", "login", "--update-adc"], check=True)
         
-        # Step 4: Set up application default credentials
-        print("Setting up application default credentials...")
-        subprocess.run(["gcloud", "auth", "application-default", "login"], check=True)
-        
-        # Step 5: Copy ADC file for future switching
-        source_adc = os.path.expanduser("~/.config/gcloud/application_default_credentials.json")
-        dest_adc = os.path.expanduser(f"~/.config/gcloud/adc_{config_name}.json")
+        # Step 3: Copy ADC file for future switching
+        source_adc = _DEFAULT_ADC
+        dest_adc = os.path.join(_GCLOUD_DIR, f"adc_{config_name}.json")
         
         if os.path.exists(source_adc):
-            subprocess.run(["cp", source_adc, dest_adc], check=True)
+            shutil.copy(source_adc, dest_adc)
             print(f"ADC credentials saved for config '{config_name}'.")
         else:
             print("Warning: ADC file not found after authentication.", file=sys.stderr)
             return
         
-        # Step 6: Handle quota project setup
-        setup_quota_project(config_name)
+        # Step 4: Handle quota project setup
+        setup_quota_project(config_name, args.quota_project, args.yes)
         
         print(f"✅ Configuration '{config_name}' created successfully!")
         print(f"You can now switch to this config using: max gcp config switch {config_name}")
         
-    except subprocess.CalledProcessError as e:
+    except (subprocess.CalledProcessError, OSError) as e:
         print(f"❌ Error creating configuration: {e}", file=sys.stderr)
         sys.exit(1)
 
-def setup_quota_project(config_name: str):
-    """Set up quota project for the given configuration."""
+def setup_quota_project(config_name: str, quota_project: Optional[str] = None, assume_yes: bool = False):
+    """Set up quota project for the given configuration.
+
+    Prompts are skipped when assume_yes is set or stdin is not a terminal: a
+    saved mapping is used as-is, no quota project is asked for, and a newly
+    set quota project is saved as the mapping for this configuration.
+
+    Args:
+        config_name: Name of the gcloud configuration being set up.
+        quota_project: Quota project ID to use instead of the saved mapping.
+        assume_yes: Answer yes to all confirmation prompts.
+    """
+    interactive = not assume_yes and sys.stdin.isatty()
     quota_project_mappings = get_quota_project_mappings()
-    quota_project = quota_project_mappings.get(config_name)
     
-    if quota_project:
-        print(f"Found existing quota project mapping: '{quota_project}'")
-        confirm = input(f"Use '{quota_project}' as quota project? (y/n): ").strip().lower()
-        if confirm not in ['y', 'yes']:
-            quota_project = None
+    if not quota_project:
+        quota_project = quota_project_mappings.get(config_name)
+        if quota_project:
+            print(f"Found existing quota project mapping: '{quota_project}'")
+            if interactive:
+                confirm = input(f"Use '{quota_project}' as quota project? (y/n): ").strip().lower()
+                if confirm not in ['y', 'yes']:
+                    quota_project = None
     
     if not quota_project:
         print("No existing quota project mapping found.")
-        quota_project = input("Enter quota project ID (or press Enter to skip): ").strip()
+        if interactive:
+            quota_project = input("Enter quota project ID (or press Enter to skip): ").strip()
     
     if quota_project:
         try:
@@ -146,7 +161,10 @@ def setup_quota_project(config_name: str):
             print(f"Quota project set to '{quota_project}'.")
             
             if config_name not in quota_project_mappings:
-                save_mapping = input(f"Save mapping '{config_name}' -> '{quota_project}' for future use? (y/n): ").strip().lower()
+                if interactive:
+                    save_mapping = input(f"Save mapping '{config_name}' -> '{quota_project}' for future use? (y/n): ").strip().lower()
+                else:
+                    save_mapping = 'y'
                 if save_mapping in ['y', 'yes']:
                     config = load_config()
                     if 'quota_project_mappings' not in config:
@@ -1,11 +1,14 @@
-"""Miscellaneous commands like backup and deploy."""
+"""Miscellaneous commands like backup and deploy.
+
+Modules used only by the CSV processing helpers (importlib.util, shutil)
+are imported inside those helpers, so backup-db and deploy-app don't load them.
+"""
 
 import os
+import stat
 import sys
-import importlib.util
 from pathlib import Path
 from typing import Any, Callable, Optional
-import shutil
 
 
 def backup_db(_args):
@@ -58,51 +61,78 @@ def _get_saved_functions_dir() -> Path:
 
 
 def _validate_csv_file(csv_path: str) -> bool:
-    """Validate that the CSV file exists and is readable.
+    """Validate that the CSV file exists.
+    
+    The contents are only parsed once, by _read_csv, which reports
+    malformed files.
     
     Args:
         csv_path: Path to the CSV file.
         
     Returns:
-        True if file is valid, False otherwise.
+        True if file exists, False otherwise.
     """
+    if not os.path.exists(csv_path):
+        print(f"❌ Error: CSV file not found: {csv_path}")
+        return False
+    return True
+
+
+def _read_csv(csv_path: str, engine: str = 'c') -> Optional[Any]:
+    """Load a CSV file into a pandas DataFrame.
+
+    The default C parser is used unless the pyarrow engine is requested.
+    pyarrow parses large files faster but infers some column types
+    differently (ISO dates become datetime64, integer columns with gaps are
+    typed differently), so a process_data function can see different data
+    depending on the engine. It is therefore opt-in.
+
+    Args:
+        csv_path: Path to the CSV file.
+        engine: pandas CSV parser engine, 'c' or 'pyarrow'.
+
+    Returns:
+        The loaded DataFrame, or None if the file could not be parsed.
+    """
+    import pandas as pd
     try:
-        if not os.path.exists(csv_path):
-            print(f"❌ Error: CSV file not found: {csv_path}")
-            return False
-        
-        # Try to read the first few rows to validate CSV format
-        # Import pandas here since we've already checked availability
-        import pandas as pd
-        pd.read_csv(csv_path, nrows=1)
-        return True
+        return pd.read_csv(csv_path, engine=engine)
+    except ImportError as e:
+        print(f"❌ Error: The '{engine}' CSV engine is not available: {e}")
+        print("💡 Install pyarrow (pip install pyarrow) or use the default engine.")
+        return None
     except Exception as e:
         print(f"❌ Error: Invalid CSV file: {e}")
-        return False
+        return None
 
 
 def _validate_python_file(python_path: str) -> bool:
-    """Validate that the Python file exists and is readable.
+    """Validate that the Python file exists and is a regular .py file.
     
     Args:
         python_path: Path to the Python file.
         
     Returns:
-        True if file is valid, False otherwise.
+        True if the file is valid, False otherwise.
     """
     try:
-        if not os.path.exists(python_path):
-            print(f"❌ Error: Python file not found: {python_path}")
-            return False
-        
-        if not python_path.endswith('.py'):
-            print(f"❌ Error: File must have .py extension: {python_path}")
-            return False
-            
-        return True
-    except Exception as e:
+        file_stat = os.stat(python_path)
+    except FileNotFoundError:
+        print(f"❌ Error: Python file not found: {python_path}")
+        return False
+    except OSError as e:
         print(f"❌ Error: Invalid Python file: {e}")
         return False
+    
+    if not python_path.endswith('.py'):
+        print(f"❌ Error: File must have .py extension: {python_path}")
+        return False
+    
+    if not stat.S_ISREG(file_stat.st_mode):
+        print(f"❌ Error: Invalid Python file: not a regular file: {python_path}")
+        return False
+    
+    return True
 
 
 def _load_function_from_file(python_path: str) -> Optional[Callable[..., Any]]:
@@ -117,6 +147,7 @@ def _load_function_from_file(python_path: str) -> Optional[Callable[..., Any]]:
     Returns:
         The process_data function if found, None otherwise.
     """
+    import importlib.util
     try:
         spec = importlib.util.spec_from_file_location("user_function", python_path)
         if spec is None or spec.loader is None:
@@ -148,11 +179,12 @@ def _save_function_file(source_path: str, save_name: str) -> bool:
     Returns:
         True if saved successfully, False otherwise.
     """
+    import shutil
     try:
         saved_functions_dir = _get_saved_functions_dir()
         destination_path = saved_functions_dir / f"{save_name}.py"
         
-        shutil.copy2(source_path, destination_path)
+        shutil.copyfile(source_path, destination_path)
         print(f"✅ Function saved as: {destination_path}")
         return True
     except Exception as e:
@@ -162,16 +194,41 @@ def _save_function_file(source_path: str, save_name: str) -> bool:
 
 def _list_saved_functions() -> None:
     """List all saved function files."""
-    saved_functions_dir = _get_saved_functions_dir()
-    py_files = list(saved_functions_dir.glob("*.py"))
+    with os.scandir(_get_saved_functions_dir()) as entries:
+        file_names = sorted(
+            entry.name for entry in entries
+            if entry.name.endswith(".py") and entry.is_file()
+        )
     
-    if not py_files:
+    if not file_names:
         print("📁 No saved functions found.")
         return
         
     print("📁 Saved functions:")
-    for py_file in sorted(py_files):
-        print(f"  • {py_file.stem}")
+    for file_name in file_names:
+        print(f"  • {file_name[:-3]}")
+
+
+def _print_result(result: Any, tsv: bool = False) -> None:
+    """Print the result returned by a process_data function.
+    
+    DataFrames and Series are written straight to stdout rather than built
+    as one string first.
+    
+    Args:
+        result: Value returned by process_data.
+        tsv: Write DataFrames and Series as tab-separated values instead of
+            an aligned table, which avoids padding every column to its
+            widest value on large results.
+    """
+    if tsv and hasattr(result, 'to_csv'):
+        result.to_csv(sys.stdout, sep='\t')
+    elif hasattr(result, 'to_string'):
+        result.to_string(buf=sys.stdout)
+        sys.stdout.write('\n')
+    else:
+        # For other types of results
+        print(result)
 
 
 def process_csv_data(args) -> None:
@@ -190,9 +247,6 @@ def process_csv_data(args) -> None:
     if not _check_pandas_availability():
         return
         
-    # Import pandas here after checking availability
-    import pandas as pd
-    
     # Handle listing saved functions
     if args.list_saved:
         _list_saved_functions()
@@ -213,7 +267,9 @@ def process_csv_data(args) -> None:
     try:
         # Load CSV data
         print(f"📊 Loading CSV data from: {args.csv_file}")
-        df = pd.read_csv(args.csv_file)
+        df = _read_csv(args.csv_file, args.engine)
+        if df is None:
+            return
         print(f"✅ Loaded {len(df)} rows and {len(df.columns)} columns")
         
         # Load and execute function
@@ -231,13 +287,7 @@ def process_csv_data(args) -> None:
         print("\n📋 Result:")
         print("=" * 50)
         
-        if hasattr(result, 'to_string'):
-            # If result is a DataFrame or Series
-            print(result.to_string())
-        else:
-            # For other types of results
-            print(result)
-            
+        _print_result(result, args.tsv)
         print("=" * 50)
         
         # Save function if requested
@@ -1,25 +1,27 @@
 """OpenClaw related commands for local instance management."""
 
-import subprocess
+import os
 import sys
 from typing import List
 
 
 def _run_openclaw_command(command: List[str]) -> None:
-    """Run an openclaw command and forward output.
+    """Replace the current process with an openclaw command.
+
+    MaxCLI has nothing left to do once openclaw exits, so the command takes
+    over the process (and its terminal) and its exit code becomes ours.
 
     Args:
         command: OpenClaw command parts (without the leading `openclaw`).
     """
+    sys.stdout.flush()
+    sys.stderr.flush()
     try:
-        subprocess.run(["openclaw", *command], check=True)
+        os.execvp("openclaw", ["openclaw", *command])
     except FileNotFoundError:
         print("❌ openclaw CLI was not found in PATH.", file=sys.stderr)
         print("💡 Install OpenClaw and ensure `openclaw` is available in your shell.", file=sys.stderr)
         sys.exit(1)
-    except subprocess.CalledProcessError as exc:
-        print(f"❌ OpenClaw command failed with exit code {exc.returncode}.", file=sys.stderr)
-        sys.exit(exc.returncode)
 
 
 def openclaw_status_command(args) -> None:
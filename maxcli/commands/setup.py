@@ -1,19 +1,27 @@
 """Development environment setup commands."""
 from pathlib import Path
+from typing import Any, Dict, Optional
 
-from ..config import check_initialization, get_config_value
+from ..config import check_initialization, load_config
 from ..utils.system import (
     run, install_homebrew, install_brew_packages, install_cask_apps,
     install_ohmyzsh, install_pipx_tools
 )
 from ..utils.interactive import interactive_checkbox
 
-def setup_git_config():
-    """Setup git configuration using values from config file."""
-    check_initialization()
+def setup_git_config(config: Optional[Dict[str, Any]] = None):
+    """Setup git configuration using values from config file.
+    
+    Args:
+        config: Already loaded MaxCLI configuration. When omitted, the CLI
+            initialization is checked and the configuration is loaded here.
+    """
+    if config is None:
+        check_initialization()
+        config = load_config()
     
-    git_name = get_config_value('git_name')
-    git_email = get_config_value('git_email')
+    git_name = config.get('git_name')
+    git_email = config.get('git_email')
     
     if git_name and git_email:
         run(f'git config --global user.name "{git_name}"')
@@ -22,9 +30,15 @@ def setup_git_config():
     else:
         print("⚠️ Git name/email not configured. Run 'max init' to set up.")
 
-def clone_dotfiles():
-    """Clone dotfiles repository if configured."""
-    dotfiles_repo = get_config_value('dotfiles_repo')
+def clone_dotfiles(config: Optional[Dict[str, Any]] = None):
+    """Clone dotfiles repository if configured.
+    
+    Args:
+        config: Already loaded MaxCLI configuration, loaded here when omitted.
+    """
+    if config is None:
+        config = load_config()
+    dotfiles_repo = config.get('dotfiles_repo')
     
     if not dotfiles_repo:
         print("💡 No dotfiles repository configured. Skipping...")
@@ -39,11 +53,16 @@ def clone_dotfiles():
         print("✅ Dotfiles already cloned.")
         
     # Copy common dotfiles if they exist
+    import shutil
     for dotfile in ['.zshrc', '.gitconfig']:
         source = dotfiles_path / dotfile
         dest = Path.home() / dotfile
         if source.exists():
-            run(f"cp {source} {dest}", check=False)
+            print(f"📄 Copying {source} to {dest}")
+            try:
+                shutil.copy(source, dest)
+            except OSError as e:
+                print(f"⚠️ Failed to copy {dotfile}: {e}")
 
 def minimal_setup(_args):
     """Minimal terminal and git setup for basic development."""
@@ -56,6 +75,7 @@ def minimal_setup(_args):
 def dev_full_setup(_args):
     """Complete development environment with languages and tools."""
     check_initialization()
+    config = load_config()
     
     install_homebrew()
     install_brew_packages([
@@ -69,8 +89,8 @@ def dev_full_setup(_args):
     
     install_ohmyzsh()
     install_pipx_tools()
-    setup_git_config()
-    clone_dotfiles()
+    setup_git_config(config)
+    clone_dotfiles(config)
     print("✅ Dev Full setup completed.")
 
 def interactive_app_selection():
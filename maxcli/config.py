@@ -5,6 +5,7 @@ from pathlib import Path
 from typing import Dict, Any, Optional
 
 from .utils.interactive import prompt_for_config_value
+from .utils.json_cache import cached_json_load, invalidate_json_cache
 
 # Configuration constants
 CONFIG_DIR = Path.home() / ".config" / "maxcli"
@@ -15,12 +16,14 @@ def ensure_config_dir() -> None:
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
 
 def load_config() -> Dict[str, Any]:
-    """Load configuration from file, return empty dict if file doesn't exist."""
+    """Load configuration from file, return empty dict if file doesn't exist.
+    
+    The parsed file is cached until its modification time or size changes.
+    Callers get their own copy, so they can modify it freely.
+    """
     if CONFIG_FILE.exists():
         try:
-            with open(CONFIG_FILE, 'r') as f:
-                content = json.load(f)
-                return content if isinstance(content, dict) else {}
+            return cached_json_load(CONFIG_FILE)
         except (json.JSONDecodeError, IOError) as e:
             print(f"⚠️ Warning: Could not load config file: {e}")
             return {}
@@ -28,6 +31,7 @@ def load_config() -> Dict[str, Any]:
 
 def save_config(config: Dict[str, Any]) -> bool:
     """Save configuration to file."""
+    invalidate_json_cache(CONFIG_FILE)
     ensure_config_dir()
     try:
         with open(CONFIG_FILE, 'w') as f:
@@ -79,7 +83,8 @@ def init_config(args):
     print("🚀 MaxCLI Configuration Setup")
     print("=" * 40)
     
-    # Load existing config if it exists
+    # Load existing config if it exists. The wizard edits this one copy and
+    # writes it back with a single save_config at the end.
     config = load_config()
     
     if config and not args.force:
@@ -137,8 +142,7 @@ def init_config(args):
     print("You can configure custom project mappings for different gcloud configs.")
     print("Hint: This is useful if you have multiple GCP projects and want to switch between them easily. It then changes the quota project for the given config.")
     # Load existing quota project mappings or create new ones
-    if 'quota_project_mappings' not in config:
-        config['quota_project_mappings'] = {}
+    mappings = config.setdefault('quota_project_mappings', {})
     
     manage_mappings = input("Do you want to configure GCP project mappings now? (y/n): ").lower().startswith('y')
     if manage_mappings:
@@ -152,9 +156,9 @@ def init_config(args):
                 
             project_id = prompt_for_config_value(
                 f"Project ID for '{config_name}'",
-                config['quota_project_mappings'].get(config_name)
+                mappings.get(config_name)
             )
-            config['quota_project_mappings'][config_name] = project_id
+            mappings[config_name] = project_id
     
     # Save configuration
     if save_config(config):
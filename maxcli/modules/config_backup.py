@@ -1,29 +1,33 @@
 """
-MaxCLI Configuration Management Module.
-
-This module provides comprehensive configuration management functionality:
-- Initialize MaxCLI with personal configuration
-- Backup config files from ~/.config/maxcli
-- Restore from local or remote backups
-- Save backups locally or upload to SSH targets
-- Smart merging of local and remote configurations
-- Integration with existing SSH connection profiles
-- Progress monitoring and dry-run capability
+MaxCLI Configuration Backup Library.
+
+This module implements the backup and restore operations behind the
+``max config`` commands:
+- Create local backups of ~/.config/maxcli
+- Upload, download and list backups on SSH targets
+- Validate and extract backup archives
+- Restore and merge configurations
+
+Backup archives are compressed rsync-friendly, like gzip --rsyncable: the
+deflate stream restarts at every file in the archive, so unchanged files
+compress to identical bytes and uploads only transfer what changed. This
+makes archives slightly larger than a plain tar.gz.
 """
 
-import argparse
+import gzip
 import json
-import os
+import posixpath
+import shlex
 import shutil
 import subprocess
-import sys
+import tarfile
 import tempfile
+import zlib
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Tuple, Dict, Any, List
 
-from maxcli.ssh_manager import load_ssh_targets, interactive_target_picker
-from maxcli.config import init_config as _init_config
+from maxcli.ssh_manager import load_ssh_targets
 
 
 def get_backup_filename() -> str:
@@ -36,6 +40,27 @@ def get_backup_filename() -> str:
     return f"maxcli_backup_{timestamp}.tar.gz"
 
 
+def _write_backup_archive(source_dir: Path, backup_file: Path) -> None:
+    """Write a directory to an rsync-friendly tar.gz archive.
+    
+    The deflate stream is fully flushed after every archive member, and
+    members are added in sorted order under a gzip header with no name or
+    timestamp, so an unchanged file produces the same compressed bytes in
+    every backup.
+    
+    Args:
+        source_dir: Directory to archive; stored under its own name.
+        backup_file: Path of the archive to create.
+    """
+    with open(backup_file, 'wb') as raw_file, \
+            gzip.GzipFile(filename='', mode='wb', compresslevel=6, fileobj=raw_file, mtime=0) as gz:
+        with tarfile.open(fileobj=gz, mode='w') as tar:
+            for path in [source_dir, *sorted(source_dir.rglob('*'))]:
+                arcname = Path(source_dir.name) / path.relative_to(source_dir)
+                tar.add(path, arcname=str(arcname), recursive=False)
+                gz.flush(zlib.Z_FULL_FLUSH)
+
+
 def create_local_backup(destination: Optional[str] = None) -> Tuple[bool, Optional[str]]:
     """Create a local backup of MaxCLI configuration files.
     
@@ -65,15 +90,10 @@ def create_local_backup(destination: Optional[str] = None) -> Tuple[bool, Option
     print(f"   Destination: {backup_file}")
     
     try:
-        # Create tar.gz archive
-        # make_archive automatically adds the format extension, so we need to remove it from the filename
-        base_name = str(backup_file.with_suffix('').with_suffix(''))  # Remove both .tar and .gz
-        actual_backup_path = shutil.make_archive(
-            base_name,
-            'gztar',
-            config_dir.parent,
-            'maxcli'
-        )
+        # Create tar.gz archive. Level 6 compresses config files nearly as
+        # well as gzip's maximum level 9 in a fraction of the time.
+        _write_backup_archive(config_dir, backup_file)
+        actual_backup_path = str(backup_file)
         
         print(f"✅ Backup created successfully: {actual_backup_path}")
         return True, actual_backup_path
@@ -83,6 +103,36 @@ def create_local_backup(destination: Optional[str] = None) -> Tuple[bool, Option
         return False, None
 
 
+# Directory for the OpenSSH control sockets shared by backup transfers
+SSH_CONTROL_DIR = Path.home() / ".cache" / "maxcli"
+
+
+def _ssh_command(ssh_target: Dict[str, Any]) -> List[str]:
+    """Build the ssh command used to reach a backup target.
+    
+    Connections are multiplexed through an OpenSSH control socket that stays
+    open for a minute, so listing remote backups and then downloading one
+    only pays for a single SSH handshake.
+    
+    Args:
+        ssh_target: SSH target profile
+        
+    Returns:
+        The ssh command and its options, without the destination
+    """
+    SSH_CONTROL_DIR.mkdir(parents=True, exist_ok=True, mode=0o700)
+    ssh_cmd = ["ssh"]
+    if ssh_target.get('key'):
+        ssh_cmd += ["-i", ssh_target['key']]
+    ssh_cmd += [
+        "-p", str(ssh_target.get('port', 22)),
+        "-o", "ControlMaster=auto",
+        "-o", "ControlPersist=60s",
+        "-o", f"ControlPath={SSH_CONTROL_DIR / 'cm-%C'}",
+    ]
+    return ssh_cmd
+
+
 def upload_backup_to_ssh(backup_file: str, target: str, destination: Optional[str] = None) -> bool:
     """Upload a backup file to an SSH target using rsync.
     
@@ -108,10 +158,12 @@ def upload_backup_to_ssh(backup_file: str, target: str, destination: Optional[st
     ssh_target = targets[target]
     
     # Build rsync command with proper SSH options
-    ssh_options = f"ssh -i {ssh_target['key']} -p {ssh_target.get('port', 22)}"
+    ssh_options = " ".join(shlex.quote(part) for part in _ssh_command(ssh_target))
     rsync_cmd = [
         "rsync",
-        "-avz",  # Archive mode, verbose, compress
+        "-av",  # Archive mode, verbose (no -z: the archive is already gzipped)
+        "--partial",  # Keep partially transferred files so a retry can resume
+        "--fuzzy",  # Use the previous backup on the server as the delta basis
         "--progress",  # Show progress
         "-e", ssh_options,  # Use custom SSH options
         str(backup_path),  # Use resolved path
@@ -168,8 +220,10 @@ def download_backup_from_ssh(target: str, backup_file: str, destination: Optiona
     # Build rsync command
     rsync_cmd = [
         "rsync",
-        "-avz",  # Archive mode, verbose, compress
+        "-av",  # Archive mode, verbose (no -z: the archive is already gzipped)
+        "--partial",  # Keep partially transferred files so a retry can resume
         "--progress",  # Show progress
+        "-e", " ".join(shlex.quote(part) for part in _ssh_command(ssh_target)),
         f"{ssh_target['user']}@{ssh_target['host']}:~/backups/{backup_file}",
         str(local_file)
     ]
@@ -208,18 +262,25 @@ def list_remote_backups(target: str) -> List[str]:
     
     ssh_target = targets[target]
     
-    # Build SSH command to list backups
+    # Shell builtins only: the glob already yields sorted base names, so no
+    # ls process or per-file stat is needed on the remote side
+    list_script = (
+        'cd ~/backups 2>/dev/null || exit 0; '
+        'for f in maxcli_backup_*.tar.gz; do [ -e "$f" ] && echo "$f"; done; exit 0'
+    )
+
+    # Build SSH command to list backups. The script is run by sh explicitly,
+    # since the remote login shell may not be POSIX (e.g. fish or csh).
     ssh_cmd = [
-        "ssh",
+        *_ssh_command(ssh_target),
         f"{ssh_target['user']}@{ssh_target['host']}",
-        "ls -1 ~/backups/maxcli_backup_*.tar.gz 2>/dev/null || echo ''"
+        f"sh -c {shlex.quote(list_script)}"
     ]
     
     try:
         result = subprocess.run(ssh_cmd, capture_output=True, text=True)
         if result.returncode == 0:
-            backups = [line.strip() for line in result.stdout.splitlines() if line.strip()]
-            return [Path(b).name for b in backups]
+            return [line.strip() for line in result.stdout.splitlines() if line.strip()]
         else:
             print(f"❌ Failed to list remote backups (exit code: {result.returncode})")
             return []
@@ -229,8 +290,100 @@ def list_remote_backups(target: str) -> List[str]:
         return []
 
 
+def _inside_backup_root(path: str) -> bool:
+    """Check whether a normalized archive path is the maxcli directory or below it.
+    
+    Args:
+        path: Archive path, already normalized with posixpath.normpath
+    
+    Returns:
+        True if the path stays inside maxcli/, False otherwise
+    """
+    return path == "maxcli" or path.startswith("maxcli/")
+
+
+def _check_backup_members(members: List[tarfile.TarInfo]) -> None:
+    """Check that extracting the given archive members only writes inside maxcli/.
+    
+    Every member name must be a relative path without '..' components that
+    normalizes to maxcli/ or below, links must point inside maxcli/, and no
+    member may be written through a symlink from the same archive. Only
+    regular files, directories and links are accepted.
+    
+    Args:
+        members: Members of the backup archive
+    
+    Raises:
+        ValueError: If any member could be written outside maxcli/.
+    """
+    symlinks = set()
+    has_root = False
+    for member in members:
+        name = member.name
+        if posixpath.isabs(name) or ".." in name.split("/"):
+            raise ValueError(f"unsafe path in archive: {name}")
+        path = posixpath.normpath(name)
+        if not _inside_backup_root(path):
+            raise ValueError(f"entry outside the maxcli directory: {name}")
+
+        if member.issym() or member.islnk():
+            if posixpath.isabs(member.linkname):
+                raise ValueError(f"link with an absolute target in archive: {name}")
+            # Symlink targets are relative to the link, hardlink targets to the archive root
+            base = posixpath.dirname(path) if member.issym() else ""
+            target = posixpath.normpath(posixpath.join(base, member.linkname))
+            if not _inside_backup_root(target):
+                raise ValueError(f"link pointing outside the maxcli directory: {name}")
+            if member.issym():
+                symlinks.add(path)
+        elif not (member.isfile() or member.isdir()):
+            raise ValueError(f"unsupported entry type in archive: {name}")
+
+        if path == "maxcli" and member.isdir():
+            has_root = True
+
+    if not has_root:
+        raise ValueError("maxcli directory not found in archive")
+
+    for member in members:
+        parent = posixpath.dirname(posixpath.normpath(member.name))
+        while parent:
+            if parent in symlinks:
+                raise ValueError(f"entry written through a symlink: {member.name}")
+            parent = posixpath.dirname(parent)
+
+
+def _open_backup_archive(backup_file: str) -> tarfile.TarFile:
+    """Open a backup archive and check that it only contains the maxcli directory.
+    
+    The members are validated before anything is extracted, independently of
+    the tarfile extraction filters available in the running Python version.
+    
+    Args:
+        backup_file: Path to the backup file
+    
+    Returns:
+        The opened archive; the caller is responsible for closing it.
+    
+    Raises:
+        ValueError: If the archive has no maxcli directory or has entries
+            that would be written outside it.
+        tarfile.TarError: If the file is not a readable tar.gz archive.
+    """
+    tar = tarfile.open(backup_file, 'r:gz')
+    try:
+        _check_backup_members(tar.getmembers())
+    except BaseException:
+        tar.close()
+        raise
+    return tar
+
+
 def extract_backup(backup_file: str, destination: Optional[str] = None) -> Tuple[bool, Optional[str]]:
-    """Extract a backup file to a temporary directory.
+    """Extract a backup file, by default to a temporary directory.
+    
+    The archive is streamed straight into the destination, so restoring to
+    the config directory's parent writes each file exactly once.
     
     Args:
         backup_file: Path to the backup file
@@ -253,17 +406,18 @@ def extract_backup(backup_file: str, destination: Optional[str] = None) -> Tuple
     print(f"📦 Extracting backup to {extract_dir}...")
     
     try:
-        # Extract the archive
-        shutil.unpack_archive(backup_file, extract_dir, 'gztar')
-        config_dir = extract_dir / "maxcli"
-        
-        if not config_dir.exists():
-            print("❌ Invalid backup: maxcli directory not found in archive")
-            return False, None
+        with _open_backup_archive(backup_file) as tar:
+            if hasattr(tarfile, "data_filter"):
+                tar.extractall(extract_dir, filter="data")
+            else:
+                tar.extractall(extract_dir)
         
         print("✅ Backup extracted successfully")
-        return True, str(config_dir)
+        return True, str(extract_dir / "maxcli")
         
+    except ValueError as e:
+        print(f"❌ Invalid backup: {e}")
+        return False, None
     except Exception as e:
         print(f"❌ Failed to extract backup: {e}")
         return False, None
@@ -322,6 +476,10 @@ def merge_configs(local_config: Dict[str, Any], remote_config: Dict[str, Any]) -
 def restore_config(backup_file: str, merge: bool = False) -> bool:
     """Restore MaxCLI configuration from a backup file.
     
+    The existing configuration is moved aside and the backup is extracted
+    directly into its place. When merging, the module configuration from the
+    backup is combined with the local one before anything is changed.
+    
     Args:
         backup_file: Path to the backup file
         merge: Whether to merge with existing configuration
@@ -331,14 +489,8 @@ def restore_config(backup_file: str, merge: bool = False) -> bool:
     """
     config_dir = Path.home() / ".config" / "maxcli"
     
-    # Extract backup to temporary directory
-    success, extracted_path = extract_backup(backup_file)
-    if not success:
-        return False
-    
-    extracted_dir = Path(extracted_path)
-    
     # If merging, load and merge configurations
+    merged_config = None
     if merge and config_dir.exists():
         print("🔄 Merging configurations...")
         
@@ -346,36 +498,47 @@ def restore_config(backup_file: str, merge: bool = False) -> bool:
         try:
             with open(config_dir / "modules_config.json", 'r') as f:
                 local_config = json.load(f)
-            with open(extracted_dir / "modules_config.json", 'r') as f:
-                remote_config = json.load(f)
+            with _open_backup_archive(backup_file) as tar:
+                remote_file = tar.extractfile("maxcli/modules_config.json")
+                if remote_file is None:
+                    raise ValueError("modules_config.json in backup is not a file")
+                remote_config = json.load(remote_file)
             
             # Merge configurations
             merged_config = merge_configs(local_config, remote_config)
             
-            # Save merged configuration
-            config_dir.mkdir(parents=True, exist_ok=True)
-            with open(config_dir / "modules_config.json", 'w') as f:
-                json.dump(merged_config, f, indent=2)
-            
-            print("✅ Configurations merged successfully")
-            
         except Exception as e:
             print(f"❌ Failed to merge configurations: {e}")
             return False
     
-    # Copy other configuration files
+    # Move the existing config aside as a backup
+    backup_dir = None
+    if config_dir.exists():
+        backup_time = datetime.now().strftime("%Y%m%d_%H%M%S")
+        backup_dir = config_dir.parent / f"maxcli_backup_{backup_time}"
+        try:
+            config_dir.rename(backup_dir)
+        except OSError as e:
+            print(f"❌ Failed to restore configuration: {e}")
+            return False
+        print(f"📦 Created backup of existing config at {backup_dir}")
+    
+    # Extract new configuration files into place
+    success, _ = extract_backup(backup_file, str(config_dir.parent))
+    if not success:
+        if backup_dir is not None:
+            if config_dir.exists():
+                shutil.rmtree(config_dir)
+            backup_dir.rename(config_dir)
+            print("↩️ Previous configuration put back")
+        return False
+    
     try:
-        # Create backup of existing config if it exists
-        if config_dir.exists():
-            backup_time = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_dir = config_dir.parent / f"maxcli_backup_{backup_time}"
-            shutil.copytree(config_dir, backup_dir)
-            print(f"📦 Created backup of existing config at {backup_dir}")
-        
-        # Copy new configuration files
-        if config_dir.exists():
-            shutil.rmtree(config_dir)
-        shutil.copytree(extracted_dir, config_dir)
+        # Save merged configuration
+        if merged_config is not None:
+            with open(config_dir / "modules_config.json", 'w') as f:
+                json.dump(merged_config, f, indent=2)
+            print("✅ Configurations merged successfully")
         
         print("✅ Configuration restored successfully")
         return True
@@ -383,270 +546,3 @@ def restore_config(backup_file: str, merge: bool = False) -> bool:
     except Exception as e:
         print(f"❌ Failed to restore configuration: {e}")
         return False
-
-
-def handle_config_init(args) -> None:
-    """Handle the config init command."""
-    _init_config(args)
-
-
-def handle_config_backup(args) -> None:
-    """Handle the config backup command.
-    
-    Args:
-        args: Parsed command line arguments
-    """
-    # Create local backup first
-    success, backup_file = create_local_backup(args.local_destination)
-    if not success or backup_file is None:
-        sys.exit(1)
-    
-    # If SSH target specified, upload the backup
-    if args.target:
-        if not upload_backup_to_ssh(backup_file, args.target, args.remote_destination):
-            sys.exit(1)
-    else:
-        print("\n💡 To upload this backup to a remote server, use:")
-        print(f"   max config backup --target <ssh-target>")
-
-
-def handle_config_restore(args) -> None:
-    """Handle the config restore command.
-    
-    Args:
-        args: Parsed command line arguments
-    """
-    if args.target:
-        # List available backups on remote server
-        backups = list_remote_backups(args.target)
-        if not backups:
-            print(f"❌ No backups found on {args.target}")
-            sys.exit(1)
-        
-        # Let user select a backup
-        print("\nAvailable backups:")
-        for i, backup in enumerate(backups, 1):
-            print(f"  {i}. {backup}")
-        
-        try:
-            choice = int(input("\nSelect backup to restore (number): ").strip())
-            if not (1 <= choice <= len(backups)):
-                print("❌ Invalid selection")
-                sys.exit(1)
-            
-            backup_file = backups[choice - 1]
-            
-            # Download selected backup
-            success, local_file = download_backup_from_ssh(args.target, backup_file, args.local_destination)
-            if not success or local_file is None:
-                sys.exit(1)
-            
-        except (ValueError, KeyboardInterrupt):
-            print("\n❌ Invalid selection or cancelled")
-            sys.exit(1)
-    else:
-        if args.backup_file is None:
-            print("❌ Error: --backup-file is required when not using --target")
-            sys.exit(1)
-        local_file = args.backup_file
-    
-    # Check if local config exists
-    config_dir = Path.home() / ".config" / "maxcli"
-    if config_dir.exists():
-        print("\n⚠️  Existing configuration found!")
-        print("Choose how to proceed:")
-        print("  1. Keep local configuration")
-        print("  2. Replace with backup configuration")
-        print("  3. Merge configurations (experimental)")
-        
-        try:
-            choice = int(input("\nSelect option (1-3): ").strip())
-            if choice == 1:
-                print("Keeping local configuration")
-                return
-            elif choice == 2:
-                merge = False
-            elif choice == 3:
-                merge = True
-            else:
-                print("❌ Invalid selection")
-                sys.exit(1)
-        except (ValueError, KeyboardInterrupt):
-            print("\n❌ Invalid selection or cancelled")
-            sys.exit(1)
-    else:
-        merge = False
-    
-    # Restore configuration
-    if not restore_config(local_file, merge):
-        sys.exit(1)
-
-
-def register_commands(subparsers) -> None:
-    """Register configuration management commands.
-    
-    Args:
-        subparsers: ArgumentParser subparsers object to register commands to.
-    """
-    # Main config command
-    config_parser = subparsers.add_parser(
-        'config',
-        help='Configuration management for MaxCLI',
-        description="""
-Comprehensive configuration management for MaxCLI.
-
-This command provides tools to initialize, backup, and restore your MaxCLI configuration.
-All your personal settings, SSH targets, module configurations, and API keys are
-managed through these subcommands.
-
-Configuration files are stored in ~/.config/maxcli/ and include:
-- Personal git settings and API keys
-- SSH target profiles and connections  
-- Module enable/disable settings
-- Dotfiles repository configuration
-- GCP project mappings
-
-The backup and restore functionality allows you to sync your configuration across
-multiple machines or create snapshots before making changes.
-        """,
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  max config init                      # Initialize or update personal configuration
-  max config backup                    # Create local backup in ~/backups
-  max config backup --target hetzner   # Create backup and upload to 'hetzner' server
-  max config restore --target hetzner  # List and restore from remote backup
-  max config restore --backup-file ~/backups/maxcli_backup_20240321.tar.gz  # Restore from local backup
-        """
-    )
-    
-    config_subparsers = config_parser.add_subparsers(
-        title="Configuration Commands",
-        dest="config_command",
-        description="Choose a configuration operation",
-        metavar="<command>"
-    )
-    config_parser.set_defaults(func=lambda _: config_parser.print_help())
-
-    # Init subcommand
-    init_parser = config_subparsers.add_parser(
-        'init',
-        help='Initialize or update personal configuration',
-        description="""
-Initialize MaxCLI with your personal configuration settings.
-
-This is a one-time setup (or update) process that collects:
-- Git username and email for repository configuration
-- Dotfiles repository URL (optional)
-- Google Cloud Platform project mappings (optional)
-- Coolify instance URL and API key (optional)
-
-The configuration is saved to ~/.config/maxcli/config.json and used by
-other commands to personalize their behavior.
-
-After initialization, commands like 'max setup dev-full' will use your
-personal git settings and dotfiles repository automatically.
-        """,
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  max config init                      # First-time setup or update existing config
-  max config init --force              # Force reconfiguration (skip confirmation)
-        """
-    )
-    init_parser.add_argument('--force', action='store_true', help='Force reconfiguration without confirmation')
-    init_parser.set_defaults(func=handle_config_init)
-
-    # Backup subcommand
-    backup_parser = config_subparsers.add_parser(
-        'backup',
-        help='Backup MaxCLI configuration files',
-        description="""
-Backup MaxCLI configuration files from ~/.config/maxcli.
-
-This command creates a backup of your MaxCLI configuration files and can optionally
-upload it to a remote server using an existing SSH target.
-
-Features:
-- Creates timestamped backup archives
-- Option to save locally or upload to SSH target
-- Uses existing SSH connection profiles
-- Preserves file permissions and timestamps
-- Progress monitoring for uploads
-
-The backup includes all configuration files, SSH targets, and module settings.
-        """,
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  max config backup                    # Create local backup in ~/backups
-  max config backup --target hetzner   # Create backup and upload to 'hetzner' server
-  max config backup --local-destination ~/backups  # Custom local backup location
-  max config backup --target backup-server --remote-destination /backups/maxcli  # Custom remote location
-        """
-    )
-    
-    backup_parser.add_argument(
-        '--target', '-t',
-        help='SSH target name to upload backup to'
-    )
-    backup_parser.add_argument(
-        '--local-destination', '-l',
-        help='Local directory to save backup (default: ~/backups)'
-    )
-    backup_parser.add_argument(
-        '--remote-destination', '-r',
-        help='Remote directory to save backup (default: ~/backups)'
-    )
-    backup_parser.add_argument(
-        '--dry-run',
-        action='store_true',
-        help='Show what would be backed up without actually creating backup'
-    )
-    
-    backup_parser.set_defaults(func=handle_config_backup)
-
-    # Restore subcommand
-    restore_parser = config_subparsers.add_parser(
-        'restore',
-        help='Restore MaxCLI configuration from backup',
-        description="""
-Restore MaxCLI configuration from a local or remote backup.
-
-This command can restore your MaxCLI configuration from:
-- A local backup file
-- A backup stored on a remote SSH target
-
-Features:
-- Restore from local or remote backups
-- Interactive backup selection for remote backups
-- Option to keep, replace, or merge with existing configuration
-- Automatic backup of existing configuration before restore
-- Smart merging of module configurations
-
-The restore process is safe and will create a backup of your existing
-configuration before making any changes.
-        """,
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  max config restore --backup-file ~/backups/maxcli_backup_20240321.tar.gz  # Restore from local backup
-  max config restore --target hetzner  # List and restore from remote backup
-  max config restore --target backup-server --local-destination ~/restored  # Custom restore location
-        """
-    )
-    
-    restore_parser.add_argument(
-        '--target', '-t',
-        help='SSH target name to restore from'
-    )
-    restore_parser.add_argument(
-        '--backup-file', '-b',
-        help='Local backup file to restore from (required if not using --target)'
-    )
-    restore_parser.add_argument(
-        '--local-destination', '-l',
-        help='Local directory to save downloaded backup (default: ~/backups)'
-    )
-    
-    restore_parser.set_defaults(func=handle_config_restore) 
\ No newline at end of file
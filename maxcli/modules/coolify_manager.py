@@ -8,15 +8,58 @@ This module provides Coolify instance management functionality including:
 - Service lifecycle operations (start/stop/restart)
 """
 
-import argparse
-from maxcli.commands.coolify import (
-    coolify_health, coolify_services, coolify_applications, coolify_servers,
-    coolify_resources, coolify_start_service, coolify_stop_service,
-    coolify_restart_service, coolify_status, coolify_start_application,
-    coolify_stop_application, coolify_restart_application, coolify_deploy_application
+from maxcli.utils.help_text import HelpText, LazyHelpFormatter
+from maxcli.utils.lazy import LazyLoader, bind
+
+coolify_commands = LazyLoader("coolify_commands", globals(), "maxcli.commands.coolify")
+
+
+# (command, handler name, resource kind) for every subcommand that acts on
+# resources identified by UUID.
+_UUID_COMMANDS = (
+    ('start-service', 'coolify_start_service', 'service'),
+    ('stop-service', 'coolify_stop_service', 'service'),
+    ('restart-service', 'coolify_restart_service', 'service'),
+    ('start-application', 'coolify_start_application', 'application'),
+    ('stop-application', 'coolify_stop_application', 'application'),
+    ('restart-application', 'coolify_restart_application', 'application'),
+    ('deploy-application', 'coolify_deploy_application', 'application'),
 )
 
 
+def _add_uuid_parser(
+    coolify_subparsers,
+    name: str,
+    handler: str,
+    kind: str
+) -> None:
+    """Register a Coolify subcommand that acts on resources identified by UUID.
+
+    The command takes one UUID positionally, several via --uuids, or both.
+
+    Args:
+        coolify_subparsers: Coolify subparsers object to register the command to.
+        name: Subcommand name, e.g. 'start-service'.
+        handler: Name of the handler function in maxcli.commands.coolify.
+        kind: Resource kind the command acts on ('service' or 'application').
+    """
+    verb = name.split('-', 1)[0]
+    parser = coolify_subparsers.add_parser(
+        name,
+        help=f'{verb.title()} a Coolify {kind}',
+        description=HelpText(f'coolify.{name}'),
+        formatter_class=LazyHelpFormatter,
+        epilog=HelpText('coolify.uuid-command.epilog', name=name, verb=verb.title(), kind=kind)
+    )
+    parser.add_argument('uuid', nargs='?', help=f'{kind.title()} UUID to {verb}')
+    parser.add_argument(
+        '--uuids',
+        metavar='UUID,...',
+        help=f'Comma-separated {kind} UUIDs to {verb} in one run'
+    )
+    parser.set_defaults(func=bind(coolify_commands, handler))
+
+
 def register_commands(subparsers) -> None:
     """Register Coolify management commands.
     
@@ -27,29 +70,9 @@ def register_commands(subparsers) -> None:
     coolify_parser = subparsers.add_parser(
         'coolify', 
         help='Manage Coolify instance through API',
-        description="""
-Manage your Coolify instance through its REST API.
-
-This command provides comprehensive management of your Coolify resources including:
-- Health monitoring and status overview
-- Services, applications, and databases management
-- Server monitoring and resource viewing
-- Service lifecycle operations (start/stop/restart)
-
-All commands use the API key and instance URL configured during 'max init'.
-The API provides real-time information about your deployments and infrastructure.
-        """,
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  max coolify status              # Overall status overview
-  max coolify health              # Check instance health
-  max coolify services            # List all services
-  max coolify applications        # List all applications  
-  max coolify servers             # List all servers
-  max coolify start-service <uuid> # Start a specific service
-  max coolify stop-service <uuid>  # Stop a specific service
-        """
+        description=HelpText('coolify'),
+        formatter_class=LazyHelpFormatter,
+        epilog=HelpText('coolify.epilog')
     )
     coolify_subparsers = coolify_parser.add_subparsers(
         title="Coolify Commands", 
@@ -57,269 +80,68 @@ Examples:
         description="Choose a Coolify management operation",
         metavar="<command>"
     )
-    coolify_parser.set_defaults(func=coolify_status)
+    coolify_parser.set_defaults(func=bind(coolify_commands, "coolify_status"))
 
     # Health check command
     health_parser = coolify_subparsers.add_parser(
         'health', 
         help='Check Coolify instance health',
-        description="""
-Check the health status of your Coolify instance.
-
-This command calls the /health endpoint to verify that your Coolify instance
-is running and accessible. It's useful for monitoring and troubleshooting
-connectivity issues.
-        """,
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Example:
-  max coolify health              # Check instance health
-        """
+        description=HelpText('coolify.health'),
+        formatter_class=LazyHelpFormatter,
+        epilog=HelpText('coolify.health.epilog')
     )
-    health_parser.set_defaults(func=coolify_health)
+    health_parser.set_defaults(func=bind(coolify_commands, "coolify_health"))
 
     # Status overview command
     status_parser = coolify_subparsers.add_parser(
         'status', 
         help='Show overall Coolify status overview',
-        description="""
-Display a comprehensive status overview of your Coolify instance.
-
-This provides a summary view including:
-- Instance health status
-- Number of running services and applications
-- Server status and resource usage
-- Recent activity and alerts
-
-This is the default command when running 'max coolify' without arguments.
-        """,
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Example:
-  max coolify status              # Show status overview
-        """
+        description=HelpText('coolify.status'),
+        formatter_class=LazyHelpFormatter,
+        epilog=HelpText('coolify.status.epilog')
     )
-    status_parser.set_defaults(func=coolify_status)
+    status_parser.set_defaults(func=bind(coolify_commands, "coolify_status"))
 
     # Services management
     services_parser = coolify_subparsers.add_parser(
         'services', 
         help='List and manage Coolify services',
-        description="""
-List all services managed by your Coolify instance.
-
-Shows detailed information about each service including:
-- Service name and type
-- Current running status
-- Resource usage
-- Service UUID for management operations
-
-Use the service UUID with start-service, stop-service, or restart-service commands.
-        """,
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  max coolify services            # List all services
-  max coolify start-service <uuid>  # Start specific service
-        """
+        description=HelpText('coolify.services'),
+        formatter_class=LazyHelpFormatter,
+        epilog=HelpText('coolify.services.epilog')
     )
-    services_parser.set_defaults(func=coolify_services)
+    services_parser.set_defaults(func=bind(coolify_commands, "coolify_services"))
 
     # Applications management
     applications_parser = coolify_subparsers.add_parser(
         'applications', 
         help='List and manage Coolify applications',
-        description="""
-List all applications deployed through your Coolify instance.
-
-Shows detailed information about each application including:
-- Application name and repository
-- Current deployment status
-- Build and deployment history
-- Application UUID for management operations
-
-Use the application UUID with start-application, stop-application, 
-restart-application, or deploy-application commands.
-        """,
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  max coolify applications        # List all applications
-  max coolify deploy-application <uuid>  # Deploy specific application
-        """
+        description=HelpText('coolify.applications'),
+        formatter_class=LazyHelpFormatter,
+        epilog=HelpText('coolify.applications.epilog')
     )
-    applications_parser.set_defaults(func=coolify_applications)
+    applications_parser.set_defaults(func=bind(coolify_commands, "coolify_applications"))
 
     # Servers monitoring
     servers_parser = coolify_subparsers.add_parser(
         'servers', 
         help='List and monitor Coolify servers',
-        description="""
-List all servers managed by your Coolify instance.
-
-Shows detailed information about each server including:
-- Server name and hostname
-- System resource usage (CPU, memory, disk)
-- Connection status
-- Running services count
-
-This helps monitor your infrastructure health and capacity.
-        """,
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Example:
-  max coolify servers             # List all servers
-        """
+        description=HelpText('coolify.servers'),
+        formatter_class=LazyHelpFormatter,
+        epilog=HelpText('coolify.servers.epilog')
     )
-    servers_parser.set_defaults(func=coolify_servers)
+    servers_parser.set_defaults(func=bind(coolify_commands, "coolify_servers"))
 
     # Resources overview
     resources_parser = coolify_subparsers.add_parser(
         'resources', 
         help='Show all Coolify resources overview',
-        description="""
-Display a comprehensive overview of all resources in your Coolify instance.
-
-This provides a unified view of:
-- All services and their status
-- All applications and their deployment status
-- All servers and their resource usage
-- Summary statistics
-
-Useful for getting a complete picture of your Coolify infrastructure.
-        """,
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Example:
-  max coolify resources           # Show resources overview
-        """
-    )
-    resources_parser.set_defaults(func=coolify_resources)
-
-    # Service lifecycle operations
-    start_service_parser = coolify_subparsers.add_parser(
-        'start-service', 
-        help='Start a Coolify service',
-        description="""
-Start a specific Coolify service by its UUID.
-
-Use 'max coolify services' to get the UUID of the service you want to start.
-The service must be in a stopped state to be started.
-        """,
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Example:
-  max coolify start-service abc123-def456-789  # Start service with UUID
-        """
-    )
-    start_service_parser.add_argument('uuid', help='Service UUID to start')
-    start_service_parser.set_defaults(func=coolify_start_service)
-
-    stop_service_parser = coolify_subparsers.add_parser(
-        'stop-service', 
-        help='Stop a Coolify service',
-        description="""
-Stop a specific Coolify service by its UUID.
-
-Use 'max coolify services' to get the UUID of the service you want to stop.
-The service must be in a running state to be stopped.
-        """,
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Example:
-  max coolify stop-service abc123-def456-789  # Stop service with UUID
-        """
-    )
-    stop_service_parser.add_argument('uuid', help='Service UUID to stop')
-    stop_service_parser.set_defaults(func=coolify_stop_service)
-
-    restart_service_parser = coolify_subparsers.add_parser(
-        'restart-service', 
-        help='Restart a Coolify service',
-        description="""
-Restart a specific Coolify service by its UUID.
-
-Use 'max coolify services' to get the UUID of the service you want to restart.
-This will stop and then start the service, useful for applying configuration changes.
-        """,
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Example:
-  max coolify restart-service abc123-def456-789  # Restart service with UUID
-        """
+        description=HelpText('coolify.resources'),
+        formatter_class=LazyHelpFormatter,
+        epilog=HelpText('coolify.resources.epilog')
     )
-    restart_service_parser.add_argument('uuid', help='Service UUID to restart')
-    restart_service_parser.set_defaults(func=coolify_restart_service)
+    resources_parser.set_defaults(func=bind(coolify_commands, "coolify_resources"))
 
-    # Application lifecycle operations
-    start_app_parser = coolify_subparsers.add_parser(
-        'start-application', 
-        help='Start a Coolify application',
-        description="""
-Start a specific Coolify application by its UUID.
-
-Use 'max coolify applications' to get the UUID of the application you want to start.
-The application must be in a stopped state to be started.
-        """,
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Example:
-  max coolify start-application abc123-def456-789  # Start application with UUID
-        """
-    )
-    start_app_parser.add_argument('uuid', help='Application UUID to start')
-    start_app_parser.set_defaults(func=coolify_start_application)
-
-    stop_app_parser = coolify_subparsers.add_parser(
-        'stop-application', 
-        help='Stop a Coolify application',
-        description="""
-Stop a specific Coolify application by its UUID.
-
-Use 'max coolify applications' to get the UUID of the application you want to stop.
-The application must be in a running state to be stopped.
-        """,
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Example:
-  max coolify stop-application abc123-def456-789  # Stop application with UUID
-        """
-    )
-    stop_app_parser.add_argument('uuid', help='Application UUID to stop')
-    stop_app_parser.set_defaults(func=coolify_stop_application)
-
-    restart_app_parser = coolify_subparsers.add_parser(
-        'restart-application', 
-        help='Restart a Coolify application',
-        description="""
-Restart a specific Coolify application by its UUID.
-
-Use 'max coolify applications' to get the UUID of the application you want to restart.
-This will stop and then start the application.
-        """,
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Example:
-  max coolify restart-application abc123-def456-789  # Restart application with UUID
-        """
-    )
-    restart_app_parser.add_argument('uuid', help='Application UUID to restart')
-    restart_app_parser.set_defaults(func=coolify_restart_application)
-
-    deploy_app_parser = coolify_subparsers.add_parser(
-        'deploy-application', 
-        help='Deploy a Coolify application',
-        description="""
-Deploy a specific Coolify application by its UUID.
-
-Use 'max coolify applications' to get the UUID of the application you want to deploy.
-This will trigger a new deployment of the application from its configured source.
-        """,
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Example:
-  max coolify deploy-application abc123-def456-789  # Deploy application with UUID
-        """
-    )
-    deploy_app_parser.add_argument('uuid', help='Application UUID to deploy')
-    deploy_app_parser.set_defaults(func=coolify_deploy_application) 
\ No newline at end of file
+    # Service and application lifecycle operations
+    for name, handler, kind in _UUID_COMMANDS:
+        _add_uuid_parser(coolify_subparsers, name, handler, kind)
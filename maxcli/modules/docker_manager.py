@@ -7,8 +7,10 @@ This module provides Docker system management functionality including:
 - Both extensive (aggressive) and minimal (conservative) cleanup options
 """
 
-import argparse
-from maxcli.commands.docker import docker_clean_command
+from maxcli.utils.help_text import HelpText, LazyHelpFormatter
+from maxcli.utils.lazy import LazyLoader, bind
+
+docker_commands = LazyLoader("docker_commands", globals(), "maxcli.commands.docker")
 
 
 def register_commands(subparsers) -> None:
@@ -21,19 +23,9 @@ def register_commands(subparsers) -> None:
     docker_parser = subparsers.add_parser(
         'docker',
         help='Docker system management operations',
-        description="""
-Docker system management toolkit.
-
-This command provides various Docker management operations organized into subcommands.
-Use 'max docker <subcommand> --help' for detailed help on each subcommand.
-        """,
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  max docker clean --extensive    # Aggressive Docker cleanup
-  max docker clean --minimal      # Conservative Docker cleanup
-  max docker clean                # Default to minimal cleanup
-        """
+        description=HelpText('docker'),
+        formatter_class=LazyHelpFormatter,
+        epilog=HelpText('docker.epilog')
     )
     
     # Create subparsers for docker subcommands
@@ -48,33 +40,9 @@ Examples:
     clean_parser = docker_subparsers.add_parser(
         'clean',
         help='Clean up Docker system with configurable cleanup levels',
-        description="""
-Perform Docker system cleanup with configurable aggressiveness levels.
-
-Cleanup Levels:
-• --extensive: Aggressive cleanup that removes ALL unused Docker resources
-  - All stopped containers
-  - All networks not used by at least one container  
-  - All dangling images
-  - All build cache
-  - All unused volumes
-  
-• --minimal: Conservative cleanup that preserves recent/useful items
-  - Containers stopped for more than 24 hours
-  - Dangling images only (untagged/unreferenced)
-  - Unused networks
-  - Build cache older than 7 days
-  - Preserves: all tagged images, recent containers, all volumes
-
-If no level is specified, defaults to --minimal for safety.
-        """,
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  max docker clean --extensive    # Remove all unused Docker resources
-  max docker clean --minimal      # Safe cleanup preserving recent items
-  max docker clean                # Default to minimal cleanup
-        """
+        description=HelpText('docker.clean'),
+        formatter_class=LazyHelpFormatter,
+        epilog=HelpText('docker.clean.epilog')
     )
     
     # Add mutually exclusive group for cleanup level
@@ -90,4 +58,4 @@ Examples:
         help='Perform conservative cleanup (preserves recent items)'
     )
     
-    clean_parser.set_defaults(func=docker_clean_command) 
\ No newline at end of file
+    clean_parser.set_defaults(func=bind(docker_commands, "docker_clean_command")) 
\ No newline at end of file
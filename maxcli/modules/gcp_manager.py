@@ -8,8 +8,10 @@ This module provides Google Cloud Platform configuration management including:
 - Listing available configurations
 """
 
-import argparse
-from maxcli.commands.gcp import switch_config, create_config, list_configs
+from maxcli.utils.help_text import HelpText, LazyHelpFormatter
+from maxcli.utils.lazy import LazyLoader, bind
+
+gcp_commands = LazyLoader("gcp_commands", globals(), "maxcli.commands.gcp")
 
 
 def register_commands(subparsers) -> None:
@@ -22,27 +24,9 @@ def register_commands(subparsers) -> None:
     gcp_parser = subparsers.add_parser(
         'gcp',
         help='Google Cloud Platform configuration and authentication management',
-        description="""
-Google Cloud Platform configuration and authentication management for MaxCLI.
-
-This module provides comprehensive GCP management including:
-- Switching between gcloud configurations with automatic ADC switching
-- Creating new gcloud configurations with complete authentication setup
-- Managing Application Default Credentials (ADC)
-- Listing available configurations
-- Quota project management and mapping
-
-All configurations are stored with associated ADC files for seamless switching
-between different GCP projects and authentication contexts.
-        """,
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  max gcp config switch altekai        # Switch to 'altekai' configuration
-  max gcp config switch                # Interactive mode - choose from menu
-  max gcp config create myproject      # Create new config named 'myproject'
-  max gcp config list                  # List all available configurations
-        """
+        description=HelpText('gcp'),
+        formatter_class=LazyHelpFormatter,
+        epilog=HelpText('gcp.epilog')
     )
     
     # Create subparsers for GCP subcommands
@@ -58,21 +42,9 @@ Examples:
     config_parser = gcp_subparsers.add_parser(
         'config',
         help='Manage gcloud configurations and credentials',
-        description="""
-Manage gcloud configurations and their associated Application Default Credentials (ADC).
-
-This command group provides operations for:
-- Switching between existing configurations
-- Creating new configurations with authentication
-- Listing available configurations
-        """,
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  max gcp config switch altekai        # Switch to 'altekai' configuration
-  max gcp config create myproject      # Create config named 'myproject'
-  max gcp config list                  # List all available configurations
-        """
+        description=HelpText('gcp.config'),
+        formatter_class=LazyHelpFormatter,
+        epilog=HelpText('gcp.config.epilog')
     )
     
     # Create subparsers for config subcommands
@@ -88,71 +60,40 @@ Examples:
     switch_parser = config_subparsers.add_parser(
         'switch', 
         help='Switch gcloud config and application default credentials',
-        description="""
-Switch to an existing gcloud configuration and its associated Application Default Credentials (ADC).
-
-This command will:
-1. Activate the specified gcloud configuration
-2. Copy the saved ADC file for this configuration to the active ADC location
-3. Set the appropriate quota project if a mapping exists
-
-The configuration must have been previously created using 'max gcp config create' or manually set up
-with a corresponding ADC file at ~/.config/gcloud/adc_<name>.json
-
-INTERACTIVE MODE: If no configuration name is provided, you'll see an interactive menu
-with arrow key navigation to select from available configurations.
-        """,
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  max gcp config switch altekai       # Switch to 'altekai' configuration
-  max gcp config switch               # Interactive mode - choose from menu
-  max gcp config switch urbansharing  # Switch to 'urbansharing' configuration
-        """
+        description=HelpText('gcp.config.switch'),
+        formatter_class=LazyHelpFormatter,
+        epilog=HelpText('gcp.config.switch.epilog')
     )
     switch_parser.add_argument('name', nargs='?', help='Configuration name (optional - if not provided, shows interactive menu)')
-    switch_parser.set_defaults(func=switch_config)
+    switch_parser.set_defaults(func=bind(gcp_commands, "switch_config"))
 
     # Create new gcloud configuration command
     create_parser = config_subparsers.add_parser(
         'create', 
         help='Create new gcloud config with full authentication setup',
-        description="""
-Create a new gcloud configuration with complete authentication and ADC setup.
-
-This command will guide you through:
-1. Creating a new gcloud configuration
-2. Authenticating with your Google account
-3. Setting up Application Default Credentials (ADC)
-4. Saving the ADC file for future switching
-5. Configuring quota project (with smart mapping or manual input)
-
-After completion, you can switch to this configuration using 'max gcp config switch <name>'.
-        """,
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  max gcp config create myproject     # Create config named 'myproject'
-  max gcp config create altekai       # Create config with existing quota mapping
-        """
+        description=HelpText('gcp.config.create'),
+        formatter_class=LazyHelpFormatter,
+        epilog=HelpText('gcp.config.create.epilog')
     )
     create_parser.add_argument('name', help='Configuration name to create (required)')
-    create_parser.set_defaults(func=create_config)
+    create_parser.add_argument(
+        '--quota-project',
+        metavar='PROJECT',
+        help='Quota project ID to set, skipping the quota project prompts'
+    )
+    create_parser.add_argument(
+        '-y', '--yes',
+        action='store_true',
+        help='Answer yes to all prompts (implied when stdin is not a terminal)'
+    )
+    create_parser.set_defaults(func=bind(gcp_commands, "create_config"))
 
     # List available configurations command
     list_parser = config_subparsers.add_parser(
         'list', 
         help='List all available gcloud configurations with ADC files',
-        description="""
-Display all gcloud configurations that have associated Application Default Credentials (ADC) files.
-
-This shows configurations that can be used with 'max gcp config switch' command.
-Only configurations with saved ADC files in ~/.config/gcloud/adc_*.json are listed.
-        """,
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Example:
-  max gcp config list                 # Show all available configurations
-        """
+        description=HelpText('gcp.config.list'),
+        formatter_class=LazyHelpFormatter,
+        epilog=HelpText('gcp.config.list.epilog')
     )
-    list_parser.set_defaults(func=list_configs) 
\ No newline at end of file
+    list_parser.set_defaults(func=bind(gcp_commands, "list_configs")) 
\ No newline at end of file
@@ -6,8 +6,10 @@ This module provides Kubernetes management functionality including:
 - Cluster management utilities
 """
 
-import argparse
-from maxcli.commands.kubernetes import kctx
+from maxcli.utils.help_text import HelpText, LazyHelpFormatter
+from maxcli.utils.lazy import LazyLoader, bind
+
+kubernetes_commands = LazyLoader("kubernetes_commands", globals(), "maxcli.commands.kubernetes")
 
 
 def register_commands(subparsers) -> None:
@@ -20,20 +22,9 @@ def register_commands(subparsers) -> None:
     kctx_parser = subparsers.add_parser(
         'kctx', 
         help='Switch Kubernetes context',
-        description="""
-Switch the current Kubernetes context using kubectl.
-
-This is equivalent to running 'kubectl config use-context <context>' but with a shorter command.
-The context must already exist in your kubectl configuration.
-        """,
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  max kctx minikube               # Switch to minikube context
-  max kctx production-cluster     # Switch to production cluster context
-  
-To see available contexts, run: kubectl config get-contexts
-        """
+        description=HelpText('kctx'),
+        formatter_class=LazyHelpFormatter,
+        epilog=HelpText('kctx.epilog')
     )
     kctx_parser.add_argument('context', help='Kubernetes context name (required)')
-    kctx_parser.set_defaults(func=kctx) 
\ No newline at end of file
+    kctx_parser.set_defaults(func=bind(kubernetes_commands, "kctx")) 
\ No newline at end of file
@@ -8,8 +8,10 @@ This module provides miscellaneous utility functionality including:
 - Other utility commands
 """
 
-import argparse
-from maxcli.commands.misc import backup_db, deploy_app, process_csv_data
+from maxcli.utils.help_text import HelpText, LazyHelpFormatter
+from maxcli.utils.lazy import LazyLoader, bind
+
+misc_commands = LazyLoader("misc_commands", globals(), "maxcli.commands.misc")
 
 
 def register_commands(subparsers) -> None:
@@ -22,90 +24,29 @@ def register_commands(subparsers) -> None:
     backup_parser = subparsers.add_parser(
         'backup-db', 
         help='Backup PostgreSQL database to timestamped file',
-        description="""
-Create a backup of the PostgreSQL database 'mydb' using pg_dump.
-
-The backup file will be saved to ~/backups/db_<date>.sql where <date> is the current date
-in YYYY-MM-DD format. The backup directory will be created if it doesn't exist.
-
-Requirements:
-- PostgreSQL client tools (pg_dump) must be installed
-- Database 'mydb' must exist and be accessible
-- User must have read permissions on the database
-        """,
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Example:
-  max backup-db                   # Create backup file like ~/backups/db_2024-01-15.sql
-        """
+        description=HelpText('backup-db'),
+        formatter_class=LazyHelpFormatter,
+        epilog=HelpText('backup-db.epilog')
     )
-    backup_parser.set_defaults(func=backup_db)
+    backup_parser.set_defaults(func=bind(misc_commands, "backup_db"))
 
     # Application deployment command
     deploy_parser = subparsers.add_parser(
         'deploy-app', 
         help='Deploy the application (placeholder command)',
-        description="""
-Deploy the application using predefined deployment logic.
-
-NOTE: This is currently a placeholder command. The actual deployment logic
-needs to be implemented based on your specific deployment requirements.
-
-Typical deployment steps might include:
-- Building the application
-- Running tests
-- Pushing to container registry
-- Updating Kubernetes deployments
-- Running post-deployment checks
-        """,
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Example:
-  max deploy-app                  # Run deployment process
-        """
+        description=HelpText('deploy-app'),
+        formatter_class=LazyHelpFormatter,
+        epilog=HelpText('deploy-app.epilog')
     )
-    deploy_parser.set_defaults(func=deploy_app)
+    deploy_parser.set_defaults(func=bind(misc_commands, "deploy_app"))
 
     # CSV data processing command
     csv_parser = subparsers.add_parser(
         'process-csv',
         help='Process CSV data using a Python function file',
-        description="""
-Process CSV data by applying a Python function to the dataset.
-
-The Python function file must contain a function named 'process_data' that accepts
-a pandas DataFrame as input and returns the processed result. The function can
-perform any data analysis, transformation, or computation on the dataset.
-
-You can optionally save the function file for future use by providing the --save-as
-option. Saved functions are stored in the maxcli/saved_functions directory and can
-be listed using the --list-saved option.
-
-Requirements:
-- pandas library must be installed
-- Function file must contain a 'process_data' function
-- CSV file must be valid and readable
-
-Function File Format:
-The Python file should follow this pattern:
-
-    import pandas as pd
-    
-    def process_data(df: pd.DataFrame):
-        # Your data processing logic here
-        # Examples:
-        # - return df.describe()  # Statistical summary
-        # - return df.groupby('column').sum()  # Grouping
-        # - return df[df['value'] > threshold]  # Filtering
-        return processed_result
-        """,
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  max process-csv --csv-file data.csv --function-file analysis.py
-  max process-csv --csv-file sales.csv --function-file stats.py --save-as sales_analysis
-  max process-csv --list-saved                      # List saved functions
-        """
+        description=HelpText('process-csv'),
+        formatter_class=LazyHelpFormatter,
+        epilog=HelpText('process-csv.epilog')
     )
     
     # Add arguments for CSV processing command
@@ -124,10 +65,21 @@ Examples:
         type=str,
         help='Save the function file with this name for future use'
     )
+    csv_parser.add_argument(
+        '--engine',
+        choices=['c', 'pyarrow'],
+        default='c',
+        help='pandas CSV parser to use (default: c); pyarrow is faster on large files but may infer different column types'
+    )
+    csv_parser.add_argument(
+        '--tsv',
+        action='store_true',
+        help='Print table results as tab-separated values instead of an aligned table (faster for large results)'
+    )
     csv_parser.add_argument(
         '--list-saved', 
         action='store_true',
         help='List all saved function files'
     )
     
-    csv_parser.set_defaults(func=process_csv_data) 
\ No newline at end of file
+    csv_parser.set_defaults(func=bind(misc_commands, "process_csv_data")) 
\ No newline at end of file
@@ -11,9 +11,11 @@ import json
 import importlib
 import argparse
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Any
+from typing import Callable, Dict, List, NamedTuple, Optional, Set, Any, Tuple
 from datetime import datetime, timezone
 
+from maxcli.utils.help_text import HelpText, LazyHelpFormatter
+
 # Configuration constants
 CONFIG_DIR = Path.home() / ".config" / "maxcli"
 MODULES_CONFIG_FILE = CONFIG_DIR / "modules_config.json"
@@ -58,6 +60,123 @@ AVAILABLE_MODULES = {
     }
 }
 
+
+
+class ModuleSpec:
+    """Lightweight record of a module and the top-level commands it owns.
+
+    Specs are cheap to build at import time, so the CLI can decide which
+    module a command belongs to without importing any module or creating
+    any of its argument parsers.
+    """
+
+    __slots__ = ("name", "commands")
+
+    def __init__(self, name: str, commands: Tuple[str, ...]) -> None:
+        self.name = name
+        self.commands = commands
+
+    def __repr__(self) -> str:
+        return f"ModuleSpec({self.name!r}, {self.commands!r})"
+
+
+MODULE_SPECS: Tuple[ModuleSpec, ...] = tuple(
+    ModuleSpec(name, tuple(info["commands"])) for name, info in AVAILABLE_MODULES.items()
+)
+
+# Top-level command -> owning module name
+COMMAND_MODULES: Dict[str, str] = {
+    command: spec.name for spec in MODULE_SPECS for command in spec.commands
+}
+
+
+class FastCommand(NamedTuple):
+    """A command that can be dispatched without building the argument parser."""
+
+    module: Optional[str]  # Owning module, or None for always-available commands
+    handler: str  # Handler as 'package.module:function'
+    dests: Tuple[str, ...]  # Subparser dest names; unmatched trailing ones are None
+    positionals: Tuple[str, ...] = ()  # Dest names of required single-value positionals
+    options: Tuple[str, ...] = ()  # Dest names of options, left at their None default
+    flags: Tuple[str, ...] = ()  # Dest names of store_true flags, left False
+
+
+# Argv token sequences for commands that take no options. main() checks
+# these before building any parser and calls the handler directly with the
+# same namespace argparse would have produced. Commands with positionals
+# match when exactly one plain (non-flag) token follows per positional.
+# Command groups that run a default action when no subcommand is given
+# are listed with their subparser dest, which argparse leaves as None.
+FAST_COMMANDS: Dict[Tuple[str, ...], FastCommand] = {
+    ("modules",): FastCommand(
+        None, "maxcli.modules.module_manager:handle_list_modules", ("modules_command",)),
+    ("ssh", "targets"): FastCommand(
+        "ssh_manager", "maxcli.ssh_manager:handle_list_targets", ("ssh_command", "targets_command")),
+    ("ssh", "backup"): FastCommand(
+        "ssh_manager", "maxcli.ssh_backup:handle_export_ssh_keys", ("ssh_command", "backup_command")),
+    ("coolify",): FastCommand(
+        "coolify_manager", "maxcli.commands.coolify:coolify_status", ("coolify_command",)),
+    ("setup",): FastCommand("setup_manager", "maxcli.commands.setup:setup", ("setup_command",)),
+    ("modules", "list"): FastCommand(
+        None, "maxcli.modules.module_manager:handle_list_modules", ("modules_command",)),
+    ("ssh", "targets", "list"): FastCommand(
+        "ssh_manager", "maxcli.ssh_manager:handle_list_targets", ("ssh_command", "targets_command")),
+    ("ssh", "backup", "export"): FastCommand(
+        "ssh_manager", "maxcli.ssh_backup:handle_export_ssh_keys", ("ssh_command", "backup_command")),
+    ("ssh", "backup", "import"): FastCommand(
+        "ssh_manager", "maxcli.ssh_backup:handle_import_ssh_keys", ("ssh_command", "backup_command")),
+    ("gcp", "config", "list"): FastCommand(
+        "gcp_manager", "maxcli.commands.gcp:list_configs", ("gcp_command", "config_command")),
+    ("coolify", "health"): FastCommand(
+        "coolify_manager", "maxcli.commands.coolify:coolify_health", ("coolify_command",)),
+    ("coolify", "status"): FastCommand(
+        "coolify_manager", "maxcli.commands.coolify:coolify_status", ("coolify_command",)),
+    ("coolify", "services"): FastCommand(
+        "coolify_manager", "maxcli.commands.coolify:coolify_services", ("coolify_command",)),
+    ("coolify", "applications"): FastCommand(
+        "coolify_manager", "maxcli.commands.coolify:coolify_applications", ("coolify_command",)),
+    ("coolify", "servers"): FastCommand(
+        "coolify_manager", "maxcli.commands.coolify:coolify_servers", ("coolify_command",)),
+    ("coolify", "resources"): FastCommand(
+        "coolify_manager", "maxcli.commands.coolify:coolify_resources", ("coolify_command",)),
+    ("setup", "minimal"): FastCommand(
+        "setup_manager", "maxcli.commands.setup:minimal_setup", ("setup_command",)),
+    ("setup", "dev-full"): FastCommand(
+        "setup_manager", "maxcli.commands.setup:dev_full_setup", ("setup_command",)),
+    ("backup-db",): FastCommand("misc_manager", "maxcli.commands.misc:backup_db", ()),
+    ("deploy-app",): FastCommand("misc_manager", "maxcli.commands.misc:deploy_app", ()),
+    ("openclaw", "status"): FastCommand(
+        "openclaw_manager", "maxcli.commands.openclaw:openclaw_status_command", ("openclaw_command",)),
+    ("modules", "enable"): FastCommand(
+        None, "maxcli.modules.module_manager:handle_enable_module", ("modules_command",), ("module_name",)),
+    ("ssh", "targets", "remove"): FastCommand(
+        "ssh_manager", "maxcli.ssh_manager:handle_remove_target", ("ssh_command", "targets_command"), ("name",)),
+    ("ssh", "connect"): FastCommand(
+        "ssh_manager", "maxcli.ssh_manager:handle_connect_target", ("ssh_command",), ("name",)),
+    ("ssh", "copy-public-key"): FastCommand(
+        "ssh_manager", "maxcli.ssh_manager:handle_copy_public_key", ("ssh_command",), ("name",)),
+    ("ssh", "rsync", "upload-backup"): FastCommand(
+        "ssh_manager", "maxcli.ssh_rsync:handle_rsync_upload_backup", ("ssh_command", "rsync_command"), ("target",)),
+    ("ssh", "rsync", "download-backup"): FastCommand(
+        "ssh_manager", "maxcli.ssh_rsync:handle_rsync_download_backup", ("ssh_command", "rsync_command"), ("target",)),
+    ("gcp", "config", "switch"): FastCommand(
+        "gcp_manager", "maxcli.commands.gcp:switch_config", ("gcp_command", "config_command"), ("name",)),
+    ("gcp", "config", "create"): FastCommand(
+        "gcp_manager", "maxcli.commands.gcp:create_config", ("gcp_command", "config_command"), ("name",),
+        ("quota_project",), ("yes",)),
+    ("kctx",): FastCommand("kubernetes_manager", "maxcli.commands.kubernetes:kctx", (), ("context",)),
+    **{
+        ("coolify", name): FastCommand(
+            "coolify_manager", f"maxcli.commands.coolify:coolify_{name.replace('-', '_')}",
+            ("coolify_command",), ("uuid",), ("uuids",))
+        for name in (
+            "start-service", "stop-service", "restart-service",
+            "start-application", "stop-application", "restart-application",
+            "deploy-application",
+        )
+    },
+}
+
 # Default enabled modules (safe defaults)
 DEFAULT_ENABLED_MODULES = ["ssh_manager", "setup_manager", "config_manager"]
 
@@ -249,11 +368,98 @@ def get_available_modules() -> Set[str]:
     return set(AVAILABLE_MODULES.keys())
 
 
-def load_and_register_modules(subparsers) -> None:
+def _register_module(module_name: str, subparsers) -> None:
+    """Import a single module and register its commands.
+    
+    Args:
+        module_name: Name of the module under maxcli.modules.
+        subparsers: ArgumentParser subparsers object to register commands to.
+    """
+    try:
+        # Import the module
+        module = importlib.import_module(f"maxcli.modules.{module_name}")
+        
+        # Register commands if the module has the register_commands function
+        if hasattr(module, 'register_commands'):
+            module.register_commands(subparsers)
+        else:
+            print(f"⚠️  Module {module_name} does not have a register_commands function.")
+            
+    except ModuleNotFoundError:
+        print(f"⚠️  Module {module_name} not found. It may not be implemented yet.")
+    except Exception as e:
+        print(f"⚠️  Error loading module {module_name}: {e}")
+
+
+def get_module_for_command(command: str) -> Optional[str]:
+    """Look up which module provides a top-level command.
+    
+    Args:
+        command: Top-level command name, e.g. 'coolify'.
+        
+    Returns:
+        Name of the owning module, or None if no module provides the command.
+    """
+    return COMMAND_MODULES.get(command)
+
+
+def get_fast_command(argv: List[str]) -> Optional[Tuple[Callable[[argparse.Namespace], None], argparse.Namespace]]:
+    """Resolve a command that can run without building the argument parser.
+    
+    Args:
+        argv: Command-line arguments without the program name.
+        
+    Returns:
+        Tuple of (handler, parsed arguments) if argv matches a fast command
+        whose module is enabled, None otherwise. Anything argparse would
+        treat specially, such as a flag or a missing positional, returns
+        None so the full parser handles it.
+    """
+    tokens = tuple(argv)
+    spec = None
+    for split in range(len(tokens), 0, -1):
+        spec = FAST_COMMANDS.get(tokens[:split])
+        if spec is not None:
+            break
+    if spec is None:
+        return None
+    
+    values = tokens[split:]
+    if len(values) != len(spec.positionals) or any(value.startswith("-") for value in values):
+        return None
+    if spec.module is not None and spec.module not in get_enabled_modules():
+        return None
+    
+    module_path, _, func_name = spec.handler.partition(":")
+    func = getattr(importlib.import_module(module_path), func_name)
+    args = argparse.Namespace(version=False, command=tokens[0], func=func)
+    subcommands = tokens[1:split]
+    for index, dest in enumerate(spec.dests):
+        setattr(args, dest, subcommands[index] if index < len(subcommands) else None)
+    for dest, value in zip(spec.positionals, values):
+        setattr(args, dest, value)
+    for dest in spec.options:
+        setattr(args, dest, None)
+    for dest in spec.flags:
+        setattr(args, dest, False)
+    return func, args
+
+
+def load_and_register_modules(subparsers, command: Optional[str] = None) -> bool:
     """Dynamically load and register enabled modules.
     
+    When the command being run is known, only the enabled module that owns
+    it is imported and registered; the other modules' parsers are never built.
+    Unknown or disabled commands fall back to registering every enabled module
+    so argparse can report the full list of valid choices.
+    
     Args:
         subparsers: ArgumentParser subparsers object to register commands to.
+        command: Top-level command being run, or None to register all modules.
+        
+    Returns:
+        True if only the module providing command was registered, False if
+        every enabled module was registered instead.
     """
     enabled_modules = get_enabled_modules()
     
@@ -261,7 +467,18 @@ def load_and_register_modules(subparsers) -> None:
         print("ℹ️  No modules are currently enabled.")
         print("Use 'max modules list' to see available modules.")
         print("Use 'max modules enable <module_name>' to enable modules.")
-        return
+        return False
+    
+    if command is not None:
+        owner = get_module_for_command(command)
+        if owner in enabled_modules:
+            _register_module(owner, subparsers)
+            choices = getattr(subparsers, 'choices', None)
+            if choices is None or command in choices:
+                return True
+            # The module did not actually provide the command; register the
+            # rest so the parser error lists every valid choice.
+            enabled_modules = [name for name in enabled_modules if name != owner]
     
     # Handle legacy module consolidation
     legacy_ssh_modules_found = []
@@ -275,20 +492,7 @@ def load_and_register_modules(subparsers) -> None:
         elif module_name == 'ssh_manager':
             ssh_manager_enabled = True
         
-        try:
-            # Import the module
-            module = importlib.import_module(f"maxcli.modules.{module_name}")
-            
-            # Register commands if the module has the register_commands function
-            if hasattr(module, 'register_commands'):
-                module.register_commands(subparsers)
-            else:
-                print(f"⚠️  Module {module_name} does not have a register_commands function.")
-                
-        except ModuleNotFoundError:
-            print(f"⚠️  Module {module_name} not found. It may not be implemented yet.")
-        except Exception as e:
-            print(f"⚠️  Error loading module {module_name}: {e}")
+        _register_module(module_name, subparsers)
     
     # Handle legacy SSH module consolidation
     if legacy_ssh_modules_found:
@@ -300,6 +504,8 @@ def load_and_register_modules(subparsers) -> None:
             print("💡 These modules have been consolidated into 'ssh_manager'")
             print("🔧 To get SSH functionality, enable ssh_manager: max modules enable ssh_manager")
             print("🧹 Clean up old modules: max modules disable ssh_backup ssh_rsync")
+    
+    return False
 
 
 def list_modules() -> None:
@@ -485,22 +691,9 @@ def register_commands(subparsers) -> None:
     modules_parser = subparsers.add_parser(
         'modules',
         help='Manage CLI modules (enable/disable functionality)',
-        description="""
-Manage MaxCLI modules to customize which functionality is available.
-
-Each module provides a specific set of commands and functionality.
-You can enable or disable modules based on your needs to keep
-the CLI clean and focused on what you actually use.
-
-Module changes take effect after restarting your CLI session.
-        """,
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  max modules list                # Show all available modules
-  max modules enable docker_manager   # Enable Docker cleanup commands
-  max modules disable coolify_manager # Disable Coolify commands
-        """
+        description=HelpText('modules'),
+        formatter_class=LazyHelpFormatter,
+        epilog=HelpText('modules.epilog')
     )
     
     modules_subparsers = modules_parser.add_subparsers(
@@ -515,21 +708,9 @@ Examples:
     list_parser = modules_subparsers.add_parser(
         'list',
         help='List all available modules and their status',
-        description="""
-Display all available CLI modules and whether they are currently enabled or disabled.
-
-This shows:
-- All known modules in the system
-- Their current enabled/disabled status
-- Description of each module's functionality
-- Commands provided by each module
-- Instructions for enabling/disabling modules
-        """,
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Example:
-  max modules list                # Show detailed module status
-        """
+        description=HelpText('modules.list'),
+        formatter_class=LazyHelpFormatter,
+        epilog=HelpText('modules.list.epilog')
     )
     list_parser.set_defaults(func=handle_list_modules)
     
@@ -537,20 +718,9 @@ Example:
     enable_parser = modules_subparsers.add_parser(
         'enable',
         help='Enable a module',
-        description="""
-Enable a specific module to make its commands available in the CLI.
-
-The module must be available in the system. Use 'max modules list'
-to see all available modules.
-
-Changes take effect after restarting your CLI session.
-        """,
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  max modules enable docker_manager    # Enable Docker cleanup commands
-  max modules enable coolify_manager   # Enable Coolify management
-        """
+        description=HelpText('modules.enable'),
+        formatter_class=LazyHelpFormatter,
+        epilog=HelpText('modules.enable.epilog')
     )
     enable_parser.add_argument('module_name', help='Name of the module to enable')
     enable_parser.set_defaults(func=handle_enable_module)
@@ -559,21 +729,9 @@ Examples:
     disable_parser = modules_subparsers.add_parser(
         'disable',
         help='Disable one or more modules',
-        description="""
-Disable specific modules to remove their commands from the CLI.
-
-You can disable multiple modules at once by providing multiple names.
-This helps keep the CLI clean by hiding functionality you don't use.
-
-Changes take effect after restarting your CLI session.
-        """,
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  max modules disable docker_manager   # Disable Docker cleanup commands
-  max modules disable misc_manager     # Disable miscellaneous commands
-  max modules disable ssh_backup ssh_rsync  # Disable multiple legacy modules
-        """
+        description=HelpText('modules.disable'),
+        formatter_class=LazyHelpFormatter,
+        epilog=HelpText('modules.disable.epilog')
     )
     disable_parser.add_argument('module_names', nargs='+', help='Name(s) of the module(s) to disable')
     disable_parser.set_defaults(func=handle_disable_module) 
\ No newline at end of file
@@ -4,13 +4,10 @@ This module provides wrappers around the most important local OpenClaw CLI
 operations for quickly checking and controlling a local instance.
 """
 
-import argparse
+from maxcli.utils.help_text import HelpText, LazyHelpFormatter
+from maxcli.utils.lazy import LazyLoader, bind
 
-from maxcli.commands.openclaw import (
-    openclaw_status_command,
-    openclaw_gateway_command,
-    openclaw_logs_command,
-)
+openclaw_commands = LazyLoader("openclaw_commands", globals(), "maxcli.commands.openclaw")
 
 
 def register_commands(subparsers) -> None:
@@ -22,22 +19,9 @@ def register_commands(subparsers) -> None:
     openclaw_parser = subparsers.add_parser(
         "openclaw",
         help="Manage your local OpenClaw instance",
-        description="""
-OpenClaw local instance management.
-
-Provides shortcuts for common OpenClaw operations:
-- service status checks
-- gateway lifecycle operations
-- local log inspection
-        """,
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  max openclaw status
-  max openclaw gateway status
-  max openclaw gateway restart
-  max openclaw logs --lines 200
-        """,
+        description=HelpText("openclaw"),
+        formatter_class=LazyHelpFormatter,
+        epilog=HelpText("openclaw.epilog"),
     )
 
     openclaw_subparsers = openclaw_parser.add_subparsers(
@@ -52,27 +36,30 @@ Examples:
         "status",
         help="Show local OpenClaw status",
         description="Show status overview for your local OpenClaw installation.",
+        formatter_class=LazyHelpFormatter,
     )
-    status_parser.set_defaults(func=openclaw_status_command)
+    status_parser.set_defaults(func=bind(openclaw_commands, "openclaw_status_command"))
 
     # max openclaw gateway <action>
     gateway_parser = openclaw_subparsers.add_parser(
         "gateway",
         help="Control OpenClaw gateway service",
         description="Run gateway service actions: status/start/stop/restart.",
+        formatter_class=LazyHelpFormatter,
     )
     gateway_parser.add_argument(
         "gateway_action",
         choices=["status", "start", "stop", "restart"],
         help="Gateway operation to run",
     )
-    gateway_parser.set_defaults(func=openclaw_gateway_command)
+    gateway_parser.set_defaults(func=bind(openclaw_commands, "openclaw_gateway_command"))
 
     # max openclaw logs
     logs_parser = openclaw_subparsers.add_parser(
         "logs",
         help="Show OpenClaw logs",
         description="Show logs from your local OpenClaw instance.",
+        formatter_class=LazyHelpFormatter,
     )
     logs_parser.add_argument(
         "--lines",
@@ -80,7 +67,7 @@ Examples:
         default=100,
         help="Number of log lines to show (default: 100)",
     )
-    logs_parser.set_defaults(func=openclaw_logs_command)
+    logs_parser.set_defaults(func=bind(openclaw_commands, "openclaw_logs_command"))
 
     # Default behavior for `max openclaw`
     openclaw_parser.set_defaults(func=lambda _: openclaw_parser.print_help())
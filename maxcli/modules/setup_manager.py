@@ -8,8 +8,10 @@ This module provides development environment setup functionality including:
 - Interactive setup options
 """
 
-import argparse
-from maxcli.commands.setup import setup, minimal_setup, dev_full_setup, apps_setup
+from maxcli.utils.help_text import HelpText, LazyHelpFormatter
+from maxcli.utils.lazy import LazyLoader, bind
+
+setup_commands = LazyLoader("setup_commands", globals(), "maxcli.commands.setup")
 
 
 def register_commands(subparsers) -> None:
@@ -22,24 +24,9 @@ def register_commands(subparsers) -> None:
     setup_parser = subparsers.add_parser(
         'setup', 
         help='Setup a new laptop or development environment',
-        description="""
-Setup utilities for configuring a new laptop or development environment.
-
-This command provides different setup profiles:
-- minimal: Basic terminal and git configuration
-- dev-full: Complete development environment with tools and languages
-- apps: GUI applications for productivity and development
-
-Each setup profile is idempotent - you can run them multiple times safely.
-They will skip items that are already installed.
-        """,
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  max setup minimal               # Basic terminal setup
-  max setup dev-full              # Full development environment
-  max setup apps                  # Install GUI applications
-        """
+        description=HelpText('setup'),
+        formatter_class=LazyHelpFormatter,
+        epilog=HelpText('setup.epilog')
     )
     setup_subparsers = setup_parser.add_subparsers(
         title="Setup Profiles", 
@@ -47,99 +34,32 @@ Examples:
         description="Choose a setup profile based on your needs",
         metavar="<profile>"
     )
-    setup_parser.set_defaults(func=setup)
+    setup_parser.set_defaults(func=bind(setup_commands, "setup"))
 
     minimal_parser = setup_subparsers.add_parser(
         'minimal', 
         help='Minimal terminal and git setup for basic development',
-        description="""
-Install and configure basic development tools for terminal usage.
-
-This lightweight setup includes:
-- Homebrew package manager (if not installed)
-- Essential command-line tools: git, zsh, wget, htop, stow
-- Oh My Zsh for enhanced terminal experience
-- Basic git configuration setup
-
-Perfect for:
-- Setting up a basic development environment
-- Servers or minimal installations
-- Users who prefer to manually install additional tools
-        """,
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Example:
-  max setup minimal              # Install basic development tools
-        """
+        description=HelpText('setup.minimal'),
+        formatter_class=LazyHelpFormatter,
+        epilog=HelpText('setup.minimal.epilog')
     )
-    minimal_parser.set_defaults(func=minimal_setup)
+    minimal_parser.set_defaults(func=bind(setup_commands, "minimal_setup"))
 
     dev_full_parser = setup_subparsers.add_parser(
         'dev-full', 
         help='Complete development environment with languages and tools',
-        description="""
-Install a comprehensive development environment with popular tools and languages.
-
-This full setup includes everything from 'minimal' plus:
-- Programming languages: Node.js (via nvm), Python
-- Container tools: Docker, kubectl  
-- Cloud tools: AWS CLI, Google Cloud SDK, Terraform
-- Development tools: tmux for terminal multiplexing, stow for dotfile management
-- Essential GUI apps: Rectangle (window manager), Shottr (screenshot utility)
-- pipx for Python CLI tool management
-- Dotfiles cloning and configuration
-
-Perfect for:
-- New developer laptops
-- Setting up a complete coding environment
-- Full-stack development work
-- DevOps and cloud development
-
-NOTE: You'll need to update the dotfiles repository URL in the configuration.
-        """,
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Example:
-  max setup dev-full             # Install complete development environment
-        """
+        description=HelpText('setup.dev-full'),
+        formatter_class=LazyHelpFormatter,
+        epilog=HelpText('setup.dev-full.epilog')
     )
-    dev_full_parser.set_defaults(func=dev_full_setup)
+    dev_full_parser.set_defaults(func=bind(setup_commands, "dev_full_setup"))
 
     apps_parser = setup_subparsers.add_parser(
         'apps', 
         help='Install essential GUI applications for development and productivity',
-        description="""
-Install popular GUI applications using Homebrew Cask.
-
-By default, this shows an interactive menu to choose which applications to install:
-- Development: Visual Studio Code, Cursor AI Editor, Docker Desktop, OrbStack
-- Communication: Slack  
-- Browsers: Google Chrome, Arc Browser
-- API Testing: Postman
-- Terminal: Ghostty (modern GPU-accelerated terminal)
-
-BATCH MODE: Use --all flag to install all applications without prompting.
-Interactive mode allows you to select individual apps, install all, or skip installation entirely.
-
-All applications are installed via Homebrew Cask, making them easy to manage
-and update. The installation will skip apps that are already installed.
-
-Perfect for:
-- Setting up GUI applications on a new Mac with choice
-- Standardizing application installs across team members
-- Customizing which productivity applications to install
-        """,
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  max setup apps                 # Interactive app selection (default)
-  max setup apps --all           # Install all GUI applications without prompting
-  
-Interactive mode provides:
-- Checkbox selection with Space/Enter (if questionary available)
-- Numbered selection with fallback mode
-- Options to install all, none, or specific applications
-        """
+        description=HelpText('setup.apps'),
+        formatter_class=LazyHelpFormatter,
+        epilog=HelpText('setup.apps.epilog')
     )
     apps_parser.add_argument('--all', action='store_true', help='Install all applications without prompting')
-    apps_parser.set_defaults(func=apps_setup) 
\ No newline at end of file
+    apps_parser.set_defaults(func=bind(setup_commands, "apps_setup")) 
\ No newline at end of file
@@ -11,6 +11,8 @@ import sys
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any, Union
 
+from maxcli.utils.json_cache import cached_json_load, invalidate_json_cache
+
 
 # Configuration constants
 CONFIG_DIR = Path.home() / ".config" / "maxcli"
@@ -26,6 +28,9 @@ def ensure_config_directory() -> None:
 def load_ssh_targets() -> Dict[str, Dict[str, Any]]:
     """Load SSH targets from the JSON configuration file.
     
+    The parsed file is cached until its modification time or size changes;
+    callers get their own copy and may modify it.
+    
     Returns:
         Dictionary of SSH targets with name as key and profile data as value.
         Returns empty dict if file doesn't exist or is invalid.
@@ -34,9 +39,7 @@ def load_ssh_targets() -> Dict[str, Dict[str, Any]]:
         return {}
     
     try:
-        with open(SSH_TARGETS_FILE, 'r') as f:
-            content = json.load(f)
-            return content if isinstance(content, dict) else {}
+        return cached_json_load(SSH_TARGETS_FILE)
     except (json.JSONDecodeError, IOError) as e:
         print(f"Warning: Could not load SSH targets file: {e}")
         return {}
@@ -51,6 +54,7 @@ def save_ssh_targets(targets: Dict[str, Dict[str, Any]]) -> bool:
     Returns:
         True if saved successfully, False otherwise.
     """
+    invalidate_json_cache(SSH_TARGETS_FILE)
     try:
         ensure_config_directory()
         
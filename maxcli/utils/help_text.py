@@ -0,0 +1,106 @@
+"""
+Sidecar help text for MaxCLI commands.
+
+Long ``description``/``epilog`` blocks for subcommands live in
+``maxcli/help/<key>.txt`` rather than in the module source. Parsers are given
+a ``HelpText`` reference instead of the text itself, and ``LazyHelpFormatter``
+only reads the file when help is actually rendered, so ordinary command
+dispatch never touches the help files.
+
+``LazyHelpFormatter`` is the formatter class shared by every MaxCLI parser.
+"""
+
+import argparse
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+HELP_DIR = Path(__file__).resolve().parent.parent / "help"
+
+# Whether the terminal supports color, decided once per process (Python 3.14+)
+_COLOR_SUPPORTED: Optional[bool] = None
+
+
+class HelpText(str):
+    """Reference to a sidecar help file, resolved when help is formatted.
+
+    The string value is the help key itself, so the reference stays cheap to
+    create and readable if it is ever printed by a plain formatter.
+    """
+
+    key: str
+    fields: Dict[str, Any]
+
+    def __new__(cls, key: str, **fields: Any) -> "HelpText":
+        """Create a reference to ``maxcli/help/<key>.txt``.
+
+        Args:
+            key: Help file key, e.g. 'coolify.health' or 'coolify.health.epilog'.
+            **fields: Values substituted into ``{placeholder}`` fields of the
+                text, for help shared between similar commands.
+
+        Returns:
+            The help text reference.
+        """
+        text = super().__new__(cls, key)
+        text.key = key
+        text.fields = fields
+        return text
+
+    def resolve(self) -> str:
+        """Load the referenced help text.
+
+        Returns:
+            The help text with any template fields filled in.
+        """
+        text = load_help(self.key)
+        return text.format(**self.fields) if self.fields else text
+
+
+@lru_cache(maxsize=None)
+def load_help(key: str) -> str:
+    """Read a help text file from the help directory.
+
+    Args:
+        key: Help file key without the .txt suffix.
+
+    Returns:
+        The file contents with a leading blank line, or an empty string if
+        the file is missing.
+    """
+    try:
+        return "\n" + (HELP_DIR / f"{key}.txt").read_text(encoding="utf-8")
+    except OSError:
+        return ""
+
+
+class LazyHelpFormatter(argparse.RawDescriptionHelpFormatter):
+    """Raw description formatter shared by every MaxCLI parser.
+
+    Resolves HelpText references on demand and caches the terminal color
+    decision that newer Python versions otherwise repeat for each formatter.
+    """
+
+    def _format_text(self, text: str) -> str:
+        if isinstance(text, HelpText):
+            text = text.resolve()
+        return super()._format_text(text)
+
+    def _set_color(self, color: bool, *args: Any, **kwargs: Any) -> None:
+        # Python 3.14+ creates a formatter for every add_argument() call and
+        # each one re-checks the environment and terminal for color support.
+        # Make that decision once and reuse it for every later formatter.
+        # Any further arguments of this private hook are passed through.
+        global _COLOR_SUPPORTED
+        try:
+            from _colorize import can_colorize, decolor, get_theme
+        except ImportError:
+            super()._set_color(color, *args, **kwargs)  # type: ignore[misc]
+            return
+        if color and _COLOR_SUPPORTED is None:
+            _COLOR_SUPPORTED = can_colorize(file=kwargs.get('file'))
+        if color and _COLOR_SUPPORTED:
+            self._theme = get_theme(force_color=True).argparse
+            self._decolor = decolor
+        else:
+            super()._set_color(False, *args, **kwargs)  # type: ignore[misc]
@@ -0,0 +1,51 @@
+"""
+Cached loading of MaxCLI's JSON configuration files.
+
+Several lookups in one command often read the same file (e.g. every
+``get_config_value`` call loads config.json). Parsed files are kept until
+their modification time or size changes, so each file is only parsed once
+per run unless it is rewritten.
+"""
+
+import copy
+import json
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+# Parsed JSON files as {path: ((mtime in ns, size), content)}
+_JSON_CACHE: Dict[Any, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+
+def cached_json_load(path: Path) -> Dict[str, Any]:
+    """Load a JSON object from a file, reusing the last parse until it changes.
+
+    Callers get their own copy, so they can modify it freely.
+
+    Args:
+        path: JSON file to load.
+
+    Returns:
+        The parsed object, or an empty dict if the file holds another JSON type.
+
+    Raises:
+        OSError: If the file cannot be read.
+        json.JSONDecodeError: If the file is not valid JSON.
+    """
+    stat = path.stat()
+    version = (stat.st_mtime_ns, stat.st_size)
+    cached = _JSON_CACHE.get(path)
+    if cached is None or cached[0] != version:
+        with open(path, 'r') as f:
+            content = json.load(f)
+        cached = (version, content if isinstance(content, dict) else {})
+        _JSON_CACHE[path] = cached
+    return copy.deepcopy(cached[1])
+
+
+def invalidate_json_cache(path: Path) -> None:
+    """Forget the cached content of a JSON file that is about to be rewritten.
+
+    Args:
+        path: JSON file whose cache entry should be dropped.
+    """
+    _JSON_CACHE.pop(path, None)
@@ -0,0 +1,83 @@
+"""
+Lazy module loading for MaxCLI command handlers.
+
+Module registration only needs handler *references* to attach to parsers;
+the modules implementing those handlers are imported the first time a
+handler is actually called.
+"""
+
+import importlib
+import types
+from typing import Any, Callable, Dict, List, cast
+
+
+class LazyLoader(types.ModuleType):
+    """Module proxy that imports the real module on first attribute access.
+
+    Adapted from the TensorFlow LazyLoader. Attribute lookups are always
+    forwarded to the real module, so patching the real module also affects
+    code holding the proxy.
+    """
+
+    def __init__(self, local_name: str, parent_module_globals: Dict[str, Any], name: str) -> None:
+        """Create the proxy.
+
+        Args:
+            local_name: Name the proxy is bound to in the parent module.
+            parent_module_globals: The parent module's globals(); the real
+                module replaces the proxy there once loaded.
+            name: Fully qualified name of the module to import.
+        """
+        self._local_name = local_name
+        self._parent_module_globals = parent_module_globals
+        super().__init__(name)
+
+    def _load(self) -> types.ModuleType:
+        """Import the real module and replace the proxy in the parent module.
+
+        Returns:
+            The imported module.
+        """
+        module = importlib.import_module(self.__name__)
+        self._parent_module_globals[self._local_name] = module
+        return module
+
+    def __getattr__(self, item: str) -> Any:
+        return getattr(self._load(), item)
+
+    def __dir__(self) -> List[str]:
+        return dir(self._load())
+
+
+def bind(module: types.ModuleType, name: str) -> Callable[[Any], Any]:
+    """Create a parser handler that resolves ``module.name`` when called.
+
+    Args:
+        module: Module (or LazyLoader proxy) that defines the handler.
+        name: Name of the handler function in that module.
+
+    Returns:
+        Trampoline that calls the real handler with the parsed arguments.
+    """
+    def handler(args: Any) -> Any:
+        return getattr(module, name)(args)
+
+    handler.__name__ = name
+    handler.lazy_target = f"{module.__name__}:{name}"  # type: ignore[attr-defined]
+    return handler
+
+
+def resolve_handler(func: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """Return the real function behind a handler created by bind().
+
+    Args:
+        func: Handler taken from a parsed namespace.
+
+    Returns:
+        The underlying handler, or func itself if it is not a bind() trampoline.
+    """
+    target = getattr(func, "lazy_target", None)
+    if target is None:
+        return func
+    module_path, _, name = target.partition(":")
+    return cast(Callable[[Any], Any], getattr(importlib.import_module(module_path), name))
@@ -1,6 +1,5 @@
 """System utility functions."""
 import subprocess
-import shutil
 from typing import List
 
 def run(cmd: str, check: bool = True) -> subprocess.CompletedProcess:
@@ -10,6 +9,7 @@ def run(cmd: str, check: bool = True) -> subprocess.CompletedProcess:
 
 def is_installed(binary_name: str) -> bool:
     """Check if a binary is installed and available in PATH."""
+    import shutil
     return shutil.which(binary_name) is not None
 
 def install_homebrew():
@@ -21,16 +21,27 @@ def install_homebrew():
         print("✅ Homebrew is already installed.")
 
 def install_brew_packages(packages: List[str]):
-    """Install Homebrew packages if they're not already installed."""
+    """Install Homebrew packages if they're not already installed.
+    
+    Missing packages are installed with a single brew install, so Homebrew
+    resolves and downloads their dependencies together.
+    """
+    missing = []
     for package in packages:
         print(f"📦 Checking {package}...")
         if subprocess.run(f"brew list {package}", shell=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL).returncode != 0:
-            run(f"brew install {package}")
+            missing.append(package)
         else:
             print(f"✅ {package} already installed.")
+    
+    if missing:
+        run(f"brew install {' '.join(missing)}")
 
 def install_cask_apps(apps: List[str]):
-    """Install Homebrew Cask applications if they're not already installed."""
+    """Install Homebrew Cask applications if they're not already installed.
+    
+    Apps that are missing are installed together with one brew install --cask.
+    """
     from pathlib import Path
     
     # Map cask names to actual application names in /Applications/
@@ -45,6 +56,7 @@ def install_cask_apps(apps: List[str]):
         "docker": "Docker.app"
     }
     
+    missing = []
     for app in apps:
         print(f"🖥️ Checking {app}...")
         
@@ -68,12 +80,17 @@ def install_cask_apps(apps: List[str]):
             print(f"✅ {app} already installed via Homebrew.")
             continue
             
-        # App not found, install via Homebrew
-        try:
-            run(f"brew install --cask {app}")
-        except subprocess.CalledProcessError as e:
-            print(f"⚠️ Failed to install {app}: {e}")
-            print(f"💡 You may need to install {app} manually if Homebrew cask is not available.")
+        missing.append(app)
+    
+    if not missing:
+        return
+    
+    # Install every missing app via Homebrew in one command
+    try:
+        run(f"brew install --cask {' '.join(missing)}")
+    except subprocess.CalledProcessError as e:
+        print(f"⚠️ Failed to install one or more of {', '.join(missing)}: {e}")
+        print("💡 You may need to install them manually if Homebrew cask is not available.")
 
 def install_ohmyzsh():
     """Install Oh My Zsh if not already installed."""
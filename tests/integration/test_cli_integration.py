@@ -7,11 +7,16 @@ and argument parsing across different module combinations.
 
 import pytest
 import argparse
+import importlib
 from unittest.mock import patch, MagicMock
 from typing import Dict, Any
 
-from maxcli.modules.module_manager import load_and_register_modules, register_commands as register_module_commands
+from maxcli.modules.module_manager import (
+    load_and_register_modules, register_commands as register_module_commands,
+    get_available_modules, get_fast_command, FAST_COMMANDS
+)
 from maxcli.cli import create_parser, register_core_commands
+from maxcli.utils.lazy import resolve_handler
 from tests.utils.test_helpers import create_test_config
 
 
@@ -54,6 +59,33 @@ class TestModuleLoading:
                 assert len(ssh_modules) > 0, "SSH manager should be imported"
                 assert len(docker_modules) == 0, "Docker manager should not be imported"
     
+    def test_command_loads_only_owning_module(self, cli_test_environment, isolated_cli_parser):
+        """Test that naming a command only imports the module that provides it."""
+        parser, subparsers = isolated_cli_parser
+
+        config = create_test_config(["ssh_manager", "setup_manager", "coolify_manager"])
+
+        with patch('maxcli.modules.module_manager.load_modules_config', return_value=config):
+            with patch('importlib.import_module', wraps=importlib.import_module) as mock_import:
+                load_and_register_modules(subparsers, command='coolify')
+
+                imported_modules = [call[0][0] for call in mock_import.call_args_list]
+                assert imported_modules == ['maxcli.modules.coolify_manager']
+
+        args = parser.parse_args(['coolify', 'start-service', 'abc123'])
+        assert args.uuid == 'abc123'
+
+    def test_unknown_command_loads_all_modules(self, cli_test_environment, isolated_cli_parser):
+        """Test that an unknown command still registers every enabled module."""
+        parser, subparsers = isolated_cli_parser
+
+        config = create_test_config(["ssh_manager", "setup_manager"])
+
+        with patch('maxcli.modules.module_manager.load_modules_config', return_value=config):
+            load_and_register_modules(subparsers, command='not-a-command')
+
+        assert {'ssh', 'setup'} <= set(subparsers.choices)
+
     def test_module_loading_with_import_error(self, cli_test_environment, isolated_cli_parser):
         """Test that module loading handles import errors gracefully."""
         parser, subparsers = isolated_cli_parser
@@ -285,6 +317,79 @@ def test_various_module_combinations(module_combination, cli_test_environment, i
         assert args.command == 'init'
 
 
+@pytest.mark.parametrize("command", sorted(FAST_COMMANDS))
+def test_fast_commands_match_full_parser(command, cli_test_environment):
+    """Test that fast dispatch builds the same namespace as the full parser."""
+    argv = command + tuple(f"example-{dest}" for dest in FAST_COMMANDS[command].positionals)
+    config = create_test_config(list(get_available_modules()))
+
+    with patch('maxcli.modules.module_manager.load_modules_config', return_value=config):
+        parser = create_parser()
+        subparsers = parser.add_subparsers(dest="command")
+        register_core_commands(subparsers)
+        register_module_commands(subparsers)
+        load_and_register_modules(subparsers)
+
+        expected = parser.parse_args(list(argv))
+        func, args = get_fast_command(list(argv))
+
+    assert resolve_handler(expected.func) is func
+    expected_attrs = {k: v for k, v in vars(expected).items() if k != 'func'}
+    assert {k: v for k, v in vars(args).items() if k != 'func'} == expected_attrs
+
+
+def _leaf_commands(parser: argparse.ArgumentParser, path: tuple = ()):
+    """Yield (command path, parser) for every command without subcommands."""
+    subparsers = [a for a in parser._actions if isinstance(a, argparse._SubParsersAction)]
+    if not subparsers:
+        yield path, parser
+        return
+    for name, subparser in subparsers[0].choices.items():
+        yield from _leaf_commands(subparser, path + (name,))
+
+
+def test_argument_free_commands_are_fast(cli_test_environment):
+    """Test that every command taking no arguments is in FAST_COMMANDS with the parser's handler."""
+    config = create_test_config(list(get_available_modules()))
+
+    with patch('maxcli.modules.module_manager.load_modules_config', return_value=config):
+        parser = create_parser()
+        subparsers = parser.add_subparsers(dest="command")
+        register_core_commands(subparsers)
+        register_module_commands(subparsers)
+        load_and_register_modules(subparsers)
+
+        argument_free = [
+            (path, leaf) for path, leaf in _leaf_commands(parser)
+            if all(isinstance(action, argparse._HelpAction) for action in leaf._actions)
+        ]
+        assert argument_free, "expected commands without arguments in the full parser"
+
+        for path, leaf in argument_free:
+            command = ' '.join(path)
+            assert path in FAST_COMMANDS, f"'max {command}' takes no arguments but is missing from FAST_COMMANDS"
+            assert not FAST_COMMANDS[path].positionals, f"FAST_COMMANDS expects positionals for 'max {command}'"
+            func, _ = get_fast_command(list(path))
+            assert func is resolve_handler(leaf.get_default('func')), \
+                f"FAST_COMMANDS handler for 'max {command}' differs from the parser's"
+
+
+@pytest.mark.parametrize("argv", [
+    ['kctx'],
+    ['kctx', '-h'],
+    ['kctx', 'minikube', 'extra'],
+    ['coolify', 'start-service', '--help'],
+    ['coolify', 'status', '-h'],
+    ['gcp', 'config', 'create', 'ci', '--yes'],
+])
+def test_fast_commands_fall_back_to_parser(argv, cli_test_environment):
+    """Test that flags or the wrong number of positionals skip fast dispatch."""
+    config = create_test_config(list(get_available_modules()))
+
+    with patch('maxcli.modules.module_manager.load_modules_config', return_value=config):
+        assert get_fast_command(argv) is None
+
+
 @pytest.mark.parametrize("core_command,expected_attrs", [
     (['init'], {'command': 'init', 'force': False}),
     (['init', '--force'], {'command': 'init', 'force': True}),
@@ -9,6 +9,7 @@ Tests follow functional programming principles with comprehensive mocking of ext
 import argparse
 import json
 import subprocess
+import sys
 import tempfile
 from pathlib import Path
 from typing import Dict, List, Any
@@ -16,6 +17,7 @@ from unittest.mock import Mock, patch, mock_open, call
 
 import pytest
 
+from maxcli.utils.help_text import LazyHelpFormatter
 from maxcli.cli import (
     get_files_to_remove,
     remove_path_from_shell_config,
@@ -788,7 +790,7 @@ class TestArgumentParsing:
         # Assert: Should create parser with correct properties
         assert parser.prog == 'max'
         assert "Personal CLI" in parser.description
-        assert parser.formatter_class == argparse.RawDescriptionHelpFormatter
+        assert parser.formatter_class == LazyHelpFormatter
 
     def test_create_parser_version_argument(self) -> None:
         """Test version argument parsing."""
@@ -866,6 +868,81 @@ class TestArgumentParsing:
         assert hasattr(args, 'force')
         assert args.force is True
 
+    def test_module_help_text_loaded_only_when_formatted(self) -> None:
+        """Test that sidecar help text is read at help time, not at registration."""
+        from maxcli.modules.coolify_manager import register_commands as register_coolify
+        from maxcli.utils.help_text import load_help
+
+        # Arrange: Register a module that uses sidecar help text
+        load_help.cache_clear()
+        parser = create_parser()
+        subparsers = parser.add_subparsers(dest="command")
+        register_coolify(subparsers)
+
+        # Act: Parse a command, then render its help
+        args = parser.parse_args(['coolify', 'stop-service', 'abc123'])
+        loads_after_parse = load_help.cache_info().currsize
+        coolify_parser = subparsers.choices['coolify']
+        stop_parser = coolify_parser._subparsers._group_actions[0].choices['stop-service']
+        help_output = stop_parser.format_help()
+
+        # Assert: No help files read for dispatch; help renders file contents
+        assert args.uuid == 'abc123'
+        assert loads_after_parse == 0
+        assert "Stop a specific Coolify service by its UUID." in help_output
+        assert "max coolify stop-service abc123-def456-789" in help_output
+
+
+class TestLazyHelpFormatter:
+    """Test suite for the shared help formatter's terminal color handling."""
+
+    @patch('maxcli.utils.help_text._COLOR_SUPPORTED', None)
+    def test_color_decision_made_once_with_colorize(self) -> None:
+        """Test that the color check runs once when the private _colorize module exists."""
+        # Arrange: Fake the Python 3.14+ private _colorize module
+        colorize = Mock()
+        colorize.can_colorize.return_value = True
+
+        # Act: Enable color on two formatters
+        with patch.dict(sys.modules, {'_colorize': colorize}):
+            formatters = [LazyHelpFormatter('max'), LazyHelpFormatter('max')]
+            for formatter in formatters:
+                formatter._set_color(True)
+
+        # Assert: Terminal checked once, theme applied to both formatters
+        colorize.can_colorize.assert_called_once_with(file=None)
+        for formatter in formatters:
+            assert formatter._theme is colorize.get_theme.return_value.argparse
+            assert formatter._decolor is colorize.decolor
+
+    @patch('maxcli.utils.help_text._COLOR_SUPPORTED', None)
+    def test_falls_back_to_argparse_without_colorize(self) -> None:
+        """Test that argparse's own color handling is used if _colorize cannot be imported."""
+        # Arrange: Make the private module unimportable
+        formatter = LazyHelpFormatter('max')
+
+        # Act: Enable color
+        with patch.dict(sys.modules, {'_colorize': None}), \
+                patch.object(argparse.HelpFormatter, '_set_color', create=True) as mock_set_color:
+            formatter._set_color(True)
+
+        # Assert: Base implementation called with the requested setting
+        mock_set_color.assert_called_once_with(True)
+
+    @patch('maxcli.utils.help_text._COLOR_SUPPORTED', None)
+    def test_extra_color_arguments_are_forwarded(self) -> None:
+        """Test that arguments added to the private hook by newer Pythons are passed on."""
+        # Arrange: Make the private module unimportable
+        formatter = LazyHelpFormatter('max')
+
+        # Act: Call the hook with an extra keyword argument
+        with patch.dict(sys.modules, {'_colorize': None}), \
+                patch.object(argparse.HelpFormatter, '_set_color', create=True) as mock_set_color:
+            formatter._set_color(True, file=sys.stderr)
+
+        # Assert: Extra argument reaches the base implementation
+        mock_set_color.assert_called_once_with(True, file=sys.stderr)
+
 
 class TestMainEntryPoint:
     """Test suite for the main CLI entry point."""
@@ -886,6 +963,29 @@ class TestMainEntryPoint:
 
         # Assert: Should call display_version and exit early
         mock_display_version.assert_called_once()
+        mock_register_modules.assert_not_called()
+        mock_load_modules.assert_not_called()
+
+    @patch('maxcli.cli.load_and_register_modules')
+    @patch('maxcli.cli.register_module_commands')
+    @patch('sys.argv', ['max', '-V'])
+    def test_main_short_version_fast_path(
+        self,
+        mock_register_modules: Mock,
+        mock_load_modules: Mock,
+        capsys
+    ) -> None:
+        """Test that -V prints the version without building any parsers."""
+        from maxcli import __version__
+
+        # Act: Run main with the bare version flag
+        main()
+
+        # Assert: Version printed, no module registration performed
+        captured = capsys.readouterr()
+        assert captured.out.strip() == f"max {__version__}"
+        mock_register_modules.assert_not_called()
+        mock_load_modules.assert_not_called()
 
     @patch('maxcli.cli.load_and_register_modules')
     @patch('maxcli.cli.register_module_commands')
@@ -922,6 +1022,50 @@ class TestMainEntryPoint:
         # Assert: Should call the init_config function
         mock_init_config.assert_called_once()
 
+    @patch('maxcli.commands.coolify.coolify_health')
+    @patch('maxcli.modules.module_manager.get_enabled_modules', return_value=['coolify_manager'])
+    @patch('maxcli.cli.load_and_register_modules')
+    @patch('maxcli.cli.create_parser')
+    @patch('sys.argv', ['max', 'coolify', 'health'])
+    def test_main_fast_dispatch(
+        self,
+        mock_create_parser: Mock,
+        mock_load_modules: Mock,
+        mock_enabled_modules: Mock,
+        mock_coolify_health: Mock
+    ) -> None:
+        """Test that argument-free commands run without building the parser."""
+        # Act: Run main with a fast-dispatch command
+        main()
+
+        # Assert: Handler called directly with the namespace argparse would build
+        mock_create_parser.assert_not_called()
+        mock_load_modules.assert_not_called()
+        args = mock_coolify_health.call_args[0][0]
+        assert args.command == 'coolify'
+        assert args.coolify_command == 'health'
+        assert args.func is mock_coolify_health
+
+    @patch('maxcli.cli.update_maxcli')
+    @patch('maxcli.cli.load_and_register_modules')
+    @patch('maxcli.cli.register_module_commands')
+    @patch('sys.argv', ['max', 'update', '--check-only'])
+    def test_main_core_command_builds_only_its_parser(
+        self,
+        mock_register_modules: Mock,
+        mock_load_modules: Mock,
+        mock_update: Mock
+    ) -> None:
+        """Test that a core command skips module and module-manager registration."""
+        # Act: Run main with a core command
+        main()
+
+        # Assert: Only the update parser was needed
+        mock_register_modules.assert_not_called()
+        mock_load_modules.assert_not_called()
+        args = mock_update.call_args[0][0]
+        assert args.check_only is True
+
     @patch('maxcli.cli.load_and_register_modules')
     @patch('maxcli.cli.register_module_commands')
     def test_main_module_loading(
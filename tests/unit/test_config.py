@@ -100,6 +100,24 @@ class TestConfigLoading:
             assert "⚠️ Warning: Could not load config file" in captured.out
 
 
+    def test_load_config_reuses_parsed_file_until_saved(self, tmp_path):
+        """Test that unchanged config files are parsed once and copies are returned."""
+        config_file = tmp_path / "config.json"
+        config_file.write_text(json.dumps({"quota_project_mappings": {"dev": "dev-project"}}))
+        
+        with patch('maxcli.config.CONFIG_FILE', config_file), \
+                patch('maxcli.config.ensure_config_dir'):
+            with patch('maxcli.utils.json_cache.json.load', wraps=json.load) as mock_json_load:
+                first = load_config()
+                first["quota_project_mappings"]["prod"] = "prod-project"
+                second = load_config()
+            
+            assert mock_json_load.call_count == 1
+            assert second == {"quota_project_mappings": {"dev": "dev-project"}}
+            
+            assert save_config({"git_name": "Test User"}) is True
+            assert load_config() == {"git_name": "Test User"}
+
 class TestConfigSaving:
     """Test configuration file saving functionality."""
     
@@ -0,0 +1,163 @@
+"""
+Unit tests for the maxcli.modules.config_backup module.
+
+Tests restoring configuration backups, including rollback when a backup
+cannot be extracted and rejection of archives with entries outside maxcli/,
+and listing backups on an SSH target.
+"""
+
+import io
+import json
+import os
+import subprocess
+import tarfile
+from pathlib import Path
+from typing import Dict
+from unittest.mock import patch
+
+import pytest
+
+from maxcli.modules.config_backup import (
+    _check_backup_members,
+    _write_backup_archive,
+    list_remote_backups,
+    restore_config,
+)
+
+
+def _write_config(config_dir: Path, files: Dict[str, str]) -> None:
+    """Create a maxcli config directory with the given files."""
+    config_dir.mkdir(parents=True)
+    for name, content in files.items():
+        (config_dir / name).write_text(content)
+
+
+def _tar_member(name: str, kind: bytes = tarfile.REGTYPE, linkname: str = "") -> tarfile.TarInfo:
+    """Build a tar member without touching the file system."""
+    member = tarfile.TarInfo(name)
+    member.type = kind
+    member.linkname = linkname
+    return member
+
+
+@pytest.fixture
+def home(tmp_path: Path):
+    """Use a temporary directory as the home directory."""
+    with patch('pathlib.Path.home', return_value=tmp_path):
+        yield tmp_path
+
+
+class TestRestoreConfig:
+    """Test restoring a configuration backup over the local config."""
+
+    def test_restore_replaces_config(self, home: Path, tmp_path: Path):
+        """Test that a valid backup replaces the existing configuration."""
+        source = tmp_path / "source" / "maxcli"
+        _write_config(source, {"config.json": '{"from": "backup"}'})
+        backup_file = tmp_path / "backup.tar.gz"
+        _write_backup_archive(source, backup_file)
+
+        config_dir = home / ".config" / "maxcli"
+        _write_config(config_dir, {"config.json": '{"from": "local"}'})
+
+        assert restore_config(str(backup_file)) is True
+        assert json.loads((config_dir / "config.json").read_text()) == {"from": "backup"}
+        saved = list((home / ".config").glob("maxcli_backup_*"))
+        assert len(saved) == 1
+        assert json.loads((saved[0] / "config.json").read_text()) == {"from": "local"}
+
+    def test_corrupt_backup_puts_previous_config_back(self, home: Path, tmp_path: Path):
+        """Test that a backup that fails to extract leaves the local config in place."""
+        backup_file = tmp_path / "backup.tar.gz"
+        backup_file.write_bytes(b"not a tar.gz archive")
+
+        config_dir = home / ".config" / "maxcli"
+        _write_config(config_dir, {"config.json": '{"from": "local"}'})
+
+        assert restore_config(str(backup_file)) is False
+        assert json.loads((config_dir / "config.json").read_text()) == {"from": "local"}
+        assert not list((home / ".config").glob("maxcli_backup_*"))
+
+    def test_traversal_backup_is_rejected(self, home: Path, tmp_path: Path):
+        """Test that entries escaping maxcli/ are rejected before anything is written."""
+        backup_file = tmp_path / "backup.tar.gz"
+        payload = b"echo pwned\n"
+        with tarfile.open(backup_file, 'w:gz') as tar:
+            tar.addfile(_tar_member("maxcli", tarfile.DIRTYPE))
+            member = _tar_member("maxcli/../../.zshrc")
+            member.size = len(payload)
+            tar.addfile(member, io.BytesIO(payload))
+
+        config_dir = home / ".config" / "maxcli"
+        _write_config(config_dir, {"config.json": '{"from": "local"}'})
+
+        assert restore_config(str(backup_file)) is False
+        assert not (home / ".zshrc").exists()
+        assert json.loads((config_dir / "config.json").read_text()) == {"from": "local"}
+
+
+class TestCheckBackupMembers:
+    """Test validation of backup archive members."""
+
+    def test_accepts_regular_backup(self):
+        """Test that files, directories and internal links are accepted."""
+        _check_backup_members([
+            _tar_member("maxcli", tarfile.DIRTYPE),
+            _tar_member("maxcli/config.json"),
+            _tar_member("maxcli/current.json", tarfile.SYMTYPE, "config.json"),
+            _tar_member("maxcli/copy.json", tarfile.LNKTYPE, "maxcli/config.json"),
+        ])
+
+    @pytest.mark.parametrize("members", [
+        [_tar_member("/maxcli", tarfile.DIRTYPE)],
+        [_tar_member("maxcli", tarfile.DIRTYPE), _tar_member("maxcli/../.zshrc")],
+        [_tar_member("maxcli", tarfile.DIRTYPE), _tar_member("other/config.json")],
+        [_tar_member("maxcli", tarfile.DIRTYPE), _tar_member("maxcli/key", tarfile.SYMTYPE, "/etc/passwd")],
+        [_tar_member("maxcli", tarfile.DIRTYPE), _tar_member("maxcli/key", tarfile.SYMTYPE, "../.ssh/id_rsa")],
+        [_tar_member("maxcli", tarfile.DIRTYPE), _tar_member("maxcli/key", tarfile.LNKTYPE, ".zshrc")],
+        [
+            _tar_member("maxcli", tarfile.DIRTYPE),
+            _tar_member("maxcli/up", tarfile.SYMTYPE, "."),
+            _tar_member("maxcli/up/config.json"),
+        ],
+        [_tar_member("maxcli", tarfile.DIRTYPE), _tar_member("maxcli/pipe", tarfile.FIFOTYPE)],
+        [_tar_member("maxcli/config.json")],
+    ], ids=[
+        "absolute", "dotdot", "outside", "absolute-symlink", "escaping-symlink",
+        "escaping-hardlink", "through-symlink", "fifo", "no-root",
+    ])
+    def test_rejects_unsafe_members(self, members):
+        """Test that members which could write outside maxcli/ are rejected."""
+        with pytest.raises(ValueError):
+            _check_backup_members(members)
+
+
+class TestListRemoteBackups:
+    """Test listing the backups stored on an SSH target."""
+
+    def test_remote_command_runs_under_sh(self, tmp_path: Path):
+        """Test that the listing script is passed to sh as one quoted argument."""
+        backups = tmp_path / "backups"
+        backups.mkdir()
+        for name in ["maxcli_backup_20240102_000000.tar.gz", "maxcli_backup_20240101_000000.tar.gz", "notes.txt"]:
+            (backups / name).touch()
+        target = {'server': {'user': 'max', 'host': 'example.com', 'port': 22}}
+
+        with patch('maxcli.modules.config_backup.load_ssh_targets', return_value=target), \
+                patch('maxcli.modules.config_backup.SSH_CONTROL_DIR', tmp_path / "cm"), \
+                patch('maxcli.modules.config_backup.subprocess.run') as mock_run:
+            mock_run.return_value = subprocess.CompletedProcess([], 0, stdout="", stderr="")
+            list_remote_backups('server')
+
+        remote_command = mock_run.call_args.args[0][-1]
+        assert remote_command.startswith("sh -c '")
+
+        # Run the command as the remote login shell would
+        result = subprocess.run(
+            ["sh", "-c", remote_command], capture_output=True, text=True,
+            env={**os.environ, 'HOME': str(tmp_path)}
+        )
+        assert result.stdout.split() == [
+            "maxcli_backup_20240101_000000.tar.gz",
+            "maxcli_backup_20240102_000000.tar.gz",
+        ]
@@ -0,0 +1,224 @@
+"""
+Unit tests for the Coolify API commands.
+
+Tests make_coolify_request against a stubbed http.client connection:
+response handling for HTML login pages and API error messages, and when
+a failed request is retried. Also tests how the lifecycle commands collect
+the UUIDs they act on.
+"""
+
+import argparse
+import http.client
+from typing import Dict, List, Optional, Union
+from unittest.mock import patch
+
+import pytest
+
+from maxcli.commands.coolify import _get_uuids, get_coolify_config, make_coolify_request
+from maxcli.modules.coolify_manager import register_commands
+
+
+class FakeResponse:
+    """Minimal stand-in for http.client.HTTPResponse."""
+
+    def __init__(self, body: str):
+        self.body = body
+
+    def read(self) -> bytes:
+        return self.body.encode('utf-8')
+
+
+class FakeConnection:
+    """Stubbed http.client connection with scripted failures.
+
+    Each entry in ``send_errors`` and ``responses`` is used for one request;
+    exceptions are raised instead of being returned.
+    """
+
+    def __init__(self, responses: List[Union[str, Exception]], send_errors: Optional[List[Optional[Exception]]] = None):
+        self.responses = list(responses)
+        self.send_errors = list(send_errors or [])
+        self.requests: List[str] = []
+        self.closed = 0
+
+    def request(self, method: str, path: str, body=None, headers=None) -> None:
+        self.requests.append(method)
+        error = self.send_errors.pop(0) if self.send_errors else None
+        if error is not None:
+            raise error
+
+    def getresponse(self) -> FakeResponse:
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return FakeResponse(response)
+
+    def close(self) -> None:
+        self.closed += 1
+
+
+@pytest.fixture
+def coolify_config():
+    """Pretend Coolify is configured."""
+    with patch('maxcli.commands.coolify.get_coolify_config',
+               return_value=('token', 'https://coolify.example.com')):
+        yield
+
+
+def _request(connection: FakeConnection, *args, **kwargs):
+    with patch('maxcli.commands.coolify._get_connection', return_value=connection):
+        return make_coolify_request(*args, **kwargs)
+
+
+@pytest.mark.usefixtures('coolify_config')
+class TestMakeCoolifyRequest:
+    """Test Coolify API requests and response handling."""
+
+    def test_returns_parsed_json(self):
+        """Test that a JSON response is parsed."""
+        connection = FakeConnection(['[{"uuid": "abc"}]'])
+
+        assert _request(connection, 'services') == [{'uuid': 'abc'}]
+        assert connection.requests == ['GET']
+
+    def test_html_login_page_is_reported(self, capsys):
+        """Test that an HTML login redirect is reported as an authentication failure."""
+        connection = FakeConnection(['<!DOCTYPE html><html><body>Login</body></html>'])
+
+        assert _request(connection, 'services') is None
+        assert "Authentication failed" in capsys.readouterr().out
+
+    def test_permission_error_is_reported(self, capsys):
+        """Test that a permission message from the API is reported."""
+        connection = FakeConnection(['{"message": "You do not have permission"}'])
+
+        assert _request(connection, 'services') is None
+        assert "Permission denied" in capsys.readouterr().out
+
+    def test_not_found_is_reported(self, capsys):
+        """Test that a not-found message from the API is reported."""
+        connection = FakeConnection(['{"message": "Not found."}'])
+
+        assert _request(connection, 'services/missing') is None
+        assert "Endpoint not found" in capsys.readouterr().out
+
+    def test_get_is_retried_after_stale_connection(self):
+        """Test that a GET is retried once when the kept-alive connection was closed."""
+        connection = FakeConnection([
+            http.client.RemoteDisconnected('Remote end closed connection'),
+            '{"status": "ok"}',
+        ])
+
+        assert _request(connection, 'services') == {'status': 'ok'}
+        assert connection.requests == ['GET', 'GET']
+        assert connection.closed == 1
+
+    def test_request_failing_to_send_is_retried(self):
+        """Test that a request that never reached the server is retried whatever the method."""
+        connection = FakeConnection(['{"status": "ok"}'], send_errors=[BrokenPipeError()])
+
+        assert _request(connection, 'deploy', method='POST', data={'uuid': 'abc'}) == {'status': 'ok'}
+        assert connection.requests == ['POST', 'POST']
+
+    def test_post_is_not_retried_after_sending(self, capsys):
+        """Test that a POST is not sent twice when the response never arrives."""
+        connection = FakeConnection([http.client.RemoteDisconnected('Remote end closed connection')])
+
+        assert _request(connection, 'deploy', method='POST', data={'uuid': 'abc'}) is None
+        assert connection.requests == ['POST']
+        assert "API request failed" in capsys.readouterr().out
+
+    def test_get_is_retried_only_once(self, capsys):
+        """Test that a second failure is reported instead of retried again."""
+        connection = FakeConnection([ConnectionResetError(), ConnectionResetError()])
+
+        assert _request(connection, 'services') is None
+        assert connection.requests == ['GET', 'GET']
+        assert "API request failed" in capsys.readouterr().out
+
+
+@patch('maxcli.commands.coolify._coolify_config', None)
+class TestGetCoolifyConfig:
+    """Test reading the Coolify settings from the config."""
+
+    def test_complete_config_is_cached(self):
+        """Test that the config is read once and the URL normalized."""
+        settings = {'coolify_api_key': 'token', 'coolify_instance_url': 'https://coolify.example.com/'}
+
+        with patch('maxcli.commands.coolify.get_config_value', side_effect=settings.get) as mock_get:
+            assert get_coolify_config() == ('token', 'https://coolify.example.com')
+            assert get_coolify_config() == ('token', 'https://coolify.example.com')
+
+        assert mock_get.call_count == 2
+
+    def test_missing_config_is_not_cached(self, capsys):
+        """Test that settings saved after a failed lookup are picked up."""
+        settings: Dict[str, str] = {}
+
+        with patch('maxcli.commands.coolify.get_config_value', side_effect=settings.get):
+            assert get_coolify_config() == (None, None)
+            settings.update(coolify_api_key='token', coolify_instance_url='https://coolify.example.com')
+            assert get_coolify_config() == ('token', 'https://coolify.example.com')
+
+        assert "not configured" in capsys.readouterr().out
+
+
+class TestUuidCommands:
+    """Test the lifecycle commands that take one or more UUIDs."""
+
+    @staticmethod
+    def _parse(argv: List[str]) -> argparse.Namespace:
+        parser = argparse.ArgumentParser()
+        subparsers = parser.add_subparsers(dest='command')
+        register_commands(subparsers)
+        return parser.parse_args(argv)
+
+    def test_positional_and_batch_uuids_are_combined(self):
+        """Test that the positional UUID comes first, followed by --uuids."""
+        args = self._parse(['coolify', 'start-service', 'a', '--uuids', 'b,c'])
+
+        assert _get_uuids(args, 'service') == ['a', 'b', 'c']
+
+    def test_empty_and_repeated_uuids_are_dropped(self):
+        """Test that empty entries are skipped and each UUID is used once."""
+        args = self._parse(['coolify', 'start-service', '--uuids', 'a,,a, b ,'])
+
+        assert _get_uuids(args, 'service') == ['a', 'b']
+
+    def test_missing_uuid_exits_with_usage_error(self, capsys):
+        """Test that running a command without any UUID fails like a usage error."""
+        args = self._parse(['coolify', 'start-service'])
+
+        with pytest.raises(SystemExit) as exc_info:
+            args.func(args)
+
+        assert exc_info.value.code == 2
+        output = capsys.readouterr().out
+        assert "a service UUID is required" in output
+        assert "max coolify start-service <uuid>" in output
+
+    def test_batch_sends_one_request_per_uuid(self):
+        """Test that a batch acts on every distinct UUID once."""
+        args = self._parse(['coolify', 'restart-application', 'a', '--uuids', 'a,b'])
+
+        with patch('maxcli.commands.coolify.make_coolify_request', return_value={}) as mock_request:
+            args.func(args)
+
+        assert sorted(call.args[0] for call in mock_request.call_args_list) == [
+            '/applications/a/restart',
+            '/applications/b/restart',
+        ]
+
+    def test_batch_reports_failed_uuids(self, capsys):
+        """Test that a batch exits non-zero and names the UUIDs that failed."""
+        args = self._parse(['coolify', 'stop-service', '--uuids', 'a,b'])
+
+        def fake_request(endpoint: str):
+            return None if '/b/' in endpoint else {}
+
+        with patch('maxcli.commands.coolify.make_coolify_request', side_effect=fake_request):
+            with pytest.raises(SystemExit) as exc_info:
+                args.func(args)
+
+        assert exc_info.value.code == 1
+        assert "1 of 2 services failed: b" in capsys.readouterr().out
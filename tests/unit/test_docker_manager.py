@@ -87,7 +87,7 @@ class TestDockerCleanMinimal:
         assert "💡 For extensive cleanup" in output["stdout"]
     
     def test_minimal_cleanup_command_sequence(self, mock_subprocess):
-        """Test that minimal cleanup calls the correct sequence of commands."""
+        """Test that minimal cleanup calls the correct commands in a safe order."""
         mock_subprocess.return_value.returncode = 0
         
         docker_clean_minimal()
@@ -95,44 +95,47 @@ class TestDockerCleanMinimal:
         # Should call exactly 4 commands
         assert mock_subprocess.call_count == 4
         
-        # Verify command sequence
-        calls = mock_subprocess.call_args_list
+        # Independent prunes run concurrently, so look commands up by subcommand
+        commands = [call[0][0] for call in mock_subprocess.call_args_list]
+        by_type = {command[1]: command for command in commands}
         
         # Container prune with 24h filter
-        assert calls[0][0][0][:3] == ["docker", "container", "prune"]
-        assert "--filter" in calls[0][0][0]
-        assert "until=24h" in calls[0][0][0]
+        assert by_type["container"][:3] == ["docker", "container", "prune"]
+        assert "--filter" in by_type["container"]
+        assert "until=24h" in by_type["container"]
         
         # Image prune (dangling only)
-        assert calls[1][0][0] == ["docker", "image", "prune", "-f"]
+        assert by_type["image"] == ["docker", "image", "prune", "-f"]
         
         # Network prune
-        assert calls[2][0][0] == ["docker", "network", "prune", "-f"]
+        assert by_type["network"] == ["docker", "network", "prune", "-f"]
         
         # Builder prune with 7 day filter
-        assert calls[3][0][0][:3] == ["docker", "builder", "prune"]
-        assert "until=168h" in calls[3][0][0]
+        assert by_type["builder"][:3] == ["docker", "builder", "prune"]
+        assert "until=168h" in by_type["builder"]
+        
+        # Images and networks are only pruned after stopped containers are gone
+        order = [command[1] for command in commands]
+        assert order.index("container") < order.index("image")
+        assert order.index("container") < order.index("network")
     
     def test_partial_failure_minimal_cleanup(self, mock_subprocess):
         """Test handling when one command in minimal cleanup fails."""
-        # Mock to fail on the second call (image prune)
-        call_count = 0
-        def failing_on_second_call(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            if call_count == 2:
+        # Mock to fail on the image prune
+        def failing_image_prune(*args, **kwargs):
+            if args[0][1] == "image":
                 raise subprocess.CalledProcessError(1, args[0])
-            return MagicMock(returncode=0)
+            return MagicMock(returncode=0, stdout="", stderr="")
         
-        mock_subprocess.side_effect = failing_on_second_call
+        mock_subprocess.side_effect = failing_image_prune
         
-        # Should exit with error on first failure
+        # Should exit with error once every step has run
         with pytest.raises(SystemExit) as excinfo:
             docker_clean_minimal()
         
         assert excinfo.value.code == 1
-        # Should have stopped after the failing command
-        assert call_count == 2
+        # The other, independent prunes still run
+        assert mock_subprocess.call_count == 4
     
     def test_minimal_cleanup_error_messages(self, mock_subprocess):
         """Test that minimal cleanup shows appropriate error messages."""
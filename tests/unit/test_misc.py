@@ -0,0 +1,92 @@
+"""
+Unit tests for miscellaneous commands.
+
+Tests the CSV loading and result printing helpers used by process-csv. pandas is optional,
+so tests that need real parsing are skipped when it is not installed.
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+from maxcli.commands.misc import _print_result, _read_csv
+
+
+class TestReadCsv:
+    """Test CSV loading for process-csv."""
+
+    def test_read_csv_uses_c_engine_by_default(self):
+        """Test that the C parser is used unless another engine is requested."""
+        fake_pandas = MagicMock()
+
+        with patch.dict(sys.modules, {'pandas': fake_pandas}):
+            result = _read_csv("data.csv")
+
+        fake_pandas.read_csv.assert_called_once_with("data.csv", engine='c')
+        assert result is fake_pandas.read_csv.return_value
+
+    def test_read_csv_reports_missing_engine(self, capsys):
+        """Test that an unavailable engine is reported instead of raising."""
+        fake_pandas = MagicMock()
+        fake_pandas.read_csv.side_effect = ImportError("Missing optional dependency 'pyarrow'")
+
+        with patch.dict(sys.modules, {'pandas': fake_pandas}):
+            result = _read_csv("data.csv", 'pyarrow')
+
+        assert result is None
+        assert "The 'pyarrow' CSV engine is not available" in capsys.readouterr().out
+
+    def test_default_engine_dtypes(self, tmp_path: Path):
+        """Test that the default engine keeps pandas' standard dtype inference."""
+        pd = pytest.importorskip("pandas")
+        csv_file = tmp_path / "data.csv"
+        csv_file.write_text("day,count\n2024-01-01,1\n2024-01-02,\n")
+
+        df = _read_csv(str(csv_file))
+
+        assert not pd.api.types.is_datetime64_any_dtype(df["day"])
+        assert str(df["count"].dtype) == "float64"
+
+
+class FakeFrame:
+    """Stand-in for a pandas DataFrame with the output methods process-csv uses."""
+
+    def to_string(self, buf) -> None:
+        buf.write("   a\n0  1")
+
+    def to_csv(self, buf, sep: str = ',') -> None:
+        buf.write(f"{sep}a\n0{sep}1\n")
+
+
+class TestPrintResult:
+    """Test printing process_data results."""
+
+    def test_table_is_default_and_ends_with_newline(self, capsys):
+        """Test that frames are printed as an aligned table followed by a newline."""
+        _print_result(FakeFrame())
+
+        assert capsys.readouterr().out == "   a\n0  1\n"
+
+    def test_tsv_only_when_requested(self, capsys):
+        """Test that frames are printed as tab-separated values with --tsv."""
+        _print_result(FakeFrame(), tsv=True)
+
+        assert capsys.readouterr().out == "\ta\n0\t1\n"
+
+    def test_other_results_are_printed(self, capsys):
+        """Test that results without table output are printed as is, even with --tsv."""
+        _print_result({'total': 3}, tsv=True)
+
+        assert capsys.readouterr().out == "{'total': 3}\n"
+
+    def test_large_frame_stays_a_table(self, capsys):
+        """Test that the output format does not depend on the number of rows."""
+        pd = pytest.importorskip("pandas")
+
+        _print_result(pd.DataFrame({'a': range(20_000)}))
+
+        lines = capsys.readouterr().out.splitlines()
+        assert len(lines) == 20_001
+        assert '\t' not in lines[1]
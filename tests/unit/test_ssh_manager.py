@@ -0,0 +1,45 @@
+"""
+Unit tests for the maxcli.ssh_manager module.
+
+Tests loading and saving SSH target profiles, including reuse of the parsed
+targets file until it changes.
+"""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+from maxcli.ssh_manager import load_ssh_targets, save_ssh_targets
+
+
+class TestSshTargetsFile:
+    """Test SSH target profile loading and saving."""
+
+    def test_targets_are_parsed_once_until_saved(self, tmp_path: Path):
+        """Test that unchanged targets are cached and saving invalidates the cache."""
+        targets_file = tmp_path / "ssh_targets.json"
+        targets_file.write_text(json.dumps({"web": {"user": "max", "host": "web.example.com"}}))
+
+        with patch('maxcli.ssh_manager.SSH_TARGETS_FILE', targets_file), \
+                patch('maxcli.ssh_manager.ensure_config_directory'):
+            with patch('maxcli.utils.json_cache.json.load', wraps=json.load) as mock_json_load:
+                first = load_ssh_targets()
+                first["web"]["host"] = "changed.example.com"
+                second = load_ssh_targets()
+
+            assert mock_json_load.call_count == 1
+            assert second == {"web": {"user": "max", "host": "web.example.com"}}
+
+            assert save_ssh_targets({"db": {"user": "max", "host": "db.example.com"}}) is True
+            assert load_ssh_targets() == {"db": {"user": "max", "host": "db.example.com"}}
+
+    def test_targets_file_changed_elsewhere_is_reloaded(self, tmp_path: Path):
+        """Test that edits made outside save_ssh_targets are picked up."""
+        targets_file = tmp_path / "ssh_targets.json"
+        targets_file.write_text(json.dumps({"web": {"user": "max", "host": "web.example.com"}}))
+
+        with patch('maxcli.ssh_manager.SSH_TARGETS_FILE', targets_file):
+            assert list(load_ssh_targets()) == ["web"]
+            targets_file.write_text(json.dumps({"web": {}, "db": {}}))
+
+            assert sorted(load_ssh_targets()) == ["db", "web"]